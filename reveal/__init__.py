@@ -13,7 +13,7 @@ except Exception:
 
 # Import base classes for external use
 from .base import FileAnalyzer, register, get_analyzer
-from .treesitter import TreeSitterAnalyzer
+from .treesitter import TreeSitterAnalyzer, analyze_files
 
 # Import all built-in analyzers to register them
 from .analyzers import *
@@ -23,4 +23,5 @@ __all__ = [
     'TreeSitterAnalyzer',
     'register',
     'get_analyzer',
+    'analyze_files',
 ]
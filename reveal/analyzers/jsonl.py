@@ -5,11 +5,32 @@ Handles conversation logs, streaming data, and other line-delimited JSON formats
 
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
 from ..base import FileAnalyzer, register
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install reveal-cli[speedups]
+    orjson = None
+
+
+def _loads(line: str) -> Any:
+    """Parse one JSONL record, using orjson when available.
+
+    orjson is stricter than the stdlib (no NaN/Infinity, 64-bit ints), so
+    lines it rejects are re-parsed with json.loads - results and error
+    messages stay identical to the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
 
 @register('.jsonl', name='JSONL', icon='📜')
 class JsonlAnalyzer(FileAnalyzer):
@@ -96,9 +117,50 @@ class JsonlAnalyzer(FileAnalyzer):
         """
         DEFAULT_LIMIT = 10  # Show first 10 when no args specified
 
-        # First pass: parse all records and track metadata
-        all_records = []
-        record_types = {}
+        lines, names, summary = self._cached_parse('records', self._parse_records)
+
+        # Apply semantic slicing to each column using base class helper
+        if head or tail or range:
+            # User explicitly requested slicing - apply it
+            lines, names = [self._apply_semantic_slice(column, head, tail, range)
+                            for column in (lines, names)]
+        else:
+            # Default: show first 10 as samples
+            lines, names = lines[:DEFAULT_LIMIT], names[:DEFAULT_LIMIT]
+
+        # Build record dicts (and previews) only for the records actually shown
+        selected_records = [
+            {'line': line, 'name': name, 'preview': self._preview_line(line)}
+            for line, name in zip(lines, names)
+        ]
+
+        # Add summary as metadata (always included); copied so callers can't
+        # mutate the cached entry
+        return {
+            'records': [dict(summary)] + selected_records,
+        }
+
+    def _preview_line(self, line_num: int) -> str:
+        """Build the preview for the record on a given (1-based) line."""
+        try:
+            return self._build_preview(_loads(self.lines[line_num - 1].strip()))
+        except json.JSONDecodeError as e:
+            return f'Parse error: {str(e)[:50]}'
+
+    def _parse_records(self) -> Tuple[List[int], List[str], Dict[str, Any]]:
+        """Parse all records and track metadata in a single pass.
+
+        Record summaries are stored column-wise (parallel lists of line and
+        name) rather than as one dict per record, which keeps large files
+        compact; dicts and previews are only built for records that are shown.
+        The summary entry is formatted once here rather than on every view.
+
+        Returns:
+            Tuple of (lines, names, summary entry)
+        """
+        lines = []
+        names = []
+        record_types = Counter()
         total_records = 0
 
         for i, line in enumerate(self.lines, 1):
@@ -107,48 +169,29 @@ class JsonlAnalyzer(FileAnalyzer):
                 continue
 
             try:
-                obj = json.loads(line)
+                obj = _loads(line)
                 total_records += 1
 
                 # Track record type if present
                 rec_type = obj.get('type', 'record')
-                record_types[rec_type] = record_types.get(rec_type, 0) + 1
+                record_types[rec_type] += 1
 
                 # Store all records for slicing
-                preview = self._build_preview(obj)
-                all_records.append({
-                    'line': i,
-                    'name': f"{rec_type} #{total_records}",
-                    'preview': preview,
-                })
-
-            except json.JSONDecodeError as e:
-                # Track malformed records
-                all_records.append({
-                    'line': i,
-                    'name': f'⚠️ Invalid JSON',
-                    'preview': f'Parse error: {str(e)[:50]}',
-                })
+                lines.append(i)
+                names.append(f"{rec_type} #{total_records}")
 
-        # Apply semantic slicing using base class helper
-        if head or tail or range:
-            # User explicitly requested slicing - apply it
-            selected_records = self._apply_semantic_slice(all_records, head, tail, range)
-        else:
-            # Default: show first 10 as samples
-            selected_records = all_records[:DEFAULT_LIMIT]
+            except json.JSONDecodeError:
+                # Track malformed records
+                lines.append(i)
+                names.append('⚠️ Invalid JSON')
 
-        # Add summary as metadata (always included)
         summary = {
             'line': 0,
             'name': f'📊 Summary: {total_records} records',
-            'preview': ', '.join(f'{k}: {v}' for k, v in
-                                sorted(record_types.items(), key=lambda x: -x[1])),
+            'preview': ', '.join(f'{k}: {v}' for k, v in record_types.most_common()),
         }
 
-        return {
-            'records': [summary] + selected_records,
-        }
+        return lines, names, summary
 
     def extract_element(self, element_type: str, name: str) -> Optional[Dict[str, Any]]:
         """Extract a specific JSONL record.
@@ -187,7 +230,7 @@ class JsonlAnalyzer(FileAnalyzer):
             current += 1
             if current == record_num:
                 try:
-                    obj = json.loads(line)
+                    obj = _loads(line)
                     # Pretty print the JSON
                     pretty = json.dumps(obj, indent=2)
 
@@ -217,7 +260,7 @@ class JsonlAnalyzer(FileAnalyzer):
                 continue
 
             try:
-                obj = json.loads(line)
+                obj = _loads(line)
                 rec_type = obj.get('type', '')
 
                 if rec_type == type_filter:
@@ -9,8 +9,8 @@ from ..base import FileAnalyzer, register
 class JupyterAnalyzer(FileAnalyzer):
     """Analyzer for Jupyter Notebook files"""
 
-    def __init__(self, path: str):
-        super().__init__(path)
+    def __init__(self, path: str, source=None):
+        super().__init__(path, source)
         self.parse_error = None
         self.notebook_data = None
         self.cells = []
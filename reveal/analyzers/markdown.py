@@ -5,6 +5,14 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from ..base import FileAnalyzer, register
 
+# Patterns run over the whole content with re.MULTILINE; [^\S\n] is
+# "whitespace except newline" so matches never span lines
+_HEADING = re.compile(r'^(#{1,6})[^\S\n]+(.+)$', re.MULTILINE)
+_HEADING_START = re.compile(r'^(#{1,6})[^\S\n]', re.MULTILINE)
+_LINK = re.compile(r'\[([^\]\n]+)\]\(([^\)\n]+)\)')
+_INLINE_CODE = re.compile(r'`([^`\n]+)`')
+_URL_DOMAIN = re.compile(r'https?://([^/]+)')
+
 
 @register('.md', '.markdown', name='Markdown', icon='')
 class MarkdownAnalyzer(FileAnalyzer):
@@ -44,8 +52,8 @@ class MarkdownAnalyzer(FileAnalyzer):
         """
         result = {}
 
-        # Always extract headings
-        result['headings'] = self._extract_headings()
+        # Always extract headings (parsed once, shared by every slice view)
+        result['headings'] = list(self._cached_parse('headings', self._extract_headings))
 
         # Extract links if requested
         if extract_links:
@@ -71,18 +79,16 @@ class MarkdownAnalyzer(FileAnalyzer):
         """Extract markdown headings."""
         headings = []
 
-        for i, line in enumerate(self.lines, 1):
-            # Match heading syntax: # Heading, ## Heading, etc.
-            match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if match:
-                level = len(match.group(1))
-                title = match.group(2).strip()
-
-                headings.append({
-                    'line': i,
-                    'level': level,
-                    'name': title,
-                })
+        # Match heading syntax: # Heading, ## Heading, etc.
+        for match in _HEADING.finditer(self.content):
+            level = len(match.group(1))
+            title = match.group(2).strip()
+
+            headings.append({
+                'line': self._offset_to_line(match.start()),
+                'level': level,
+                'name': title,
+            })
 
         return headings
 
@@ -100,30 +106,27 @@ class MarkdownAnalyzer(FileAnalyzer):
         links = []
 
         # Match [text](url) pattern
-        link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
+        for match in _LINK.finditer(self.content):
+            text = match.group(1)
+            url = match.group(2)
 
-        for i, line in enumerate(self.lines, 1):
-            for match in re.finditer(link_pattern, line):
-                text = match.group(1)
-                url = match.group(2)
+            # Classify link
+            link_info = self._classify_link(url, text, self._offset_to_line(match.start()))
 
-                # Classify link
-                link_info = self._classify_link(url, text, i)
+            # Apply type filter
+            if link_type and link_type != 'all':
+                if link_info['type'] != link_type:
+                    continue
 
-                # Apply type filter
-                if link_type and link_type != 'all':
-                    if link_info['type'] != link_type:
+            # Apply domain filter (for external links)
+            if domain:
+                if link_info['type'] == 'external':
+                    if domain not in url:
                         continue
+                else:
+                    continue  # Domain filter only applies to external links
 
-                # Apply domain filter (for external links)
-                if domain:
-                    if link_info['type'] == 'external':
-                        if domain not in url:
-                            continue
-                    else:
-                        continue  # Domain filter only applies to external links
-
-                links.append(link_info)
+            links.append(link_info)
 
         return links
 
@@ -153,7 +156,7 @@ class MarkdownAnalyzer(FileAnalyzer):
             link_info['protocol'] = 'https' if url.startswith('https') else 'http'
 
             # Extract domain
-            domain_match = re.match(r'https?://([^/]+)', url)
+            domain_match = _URL_DOMAIN.match(url)
             if domain_match:
                 link_info['domain'] = domain_match.group(1)
         else:
@@ -261,23 +264,21 @@ class MarkdownAnalyzer(FileAnalyzer):
         inline_blocks = []
 
         # Match `code` pattern (single backticks)
-        inline_pattern = r'`([^`]+)`'
-
-        for i, line in enumerate(self.lines, 1):
-            for match in re.finditer(inline_pattern, line):
-                code_text = match.group(1)
-
-                # Skip if it looks like a fenced code block marker
-                if code_text.startswith('``'):
-                    continue
-
-                inline_blocks.append({
-                    'line': i,
-                    'language': 'inline',
-                    'source': code_text,
-                    'type': 'inline',
-                    'column': match.start() + 1,
-                })
+        for match in _INLINE_CODE.finditer(self.content):
+            code_text = match.group(1)
+
+            # Skip if it looks like a fenced code block marker
+            if code_text.startswith('``'):
+                continue
+
+            line = self._offset_to_line(match.start())
+            inline_blocks.append({
+                'line': line,
+                'language': 'inline',
+                'source': code_text,
+                'type': 'inline',
+                'column': match.start() - self._line_starts[line - 1] + 1,
+            })
 
         return inline_blocks
 
@@ -294,29 +295,25 @@ class MarkdownAnalyzer(FileAnalyzer):
         # Find the heading
         start_line = None
         heading_level = None
+        section_end = None
 
-        for i, line in enumerate(self.lines, 1):
-            match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if match:
-                title = match.group(2).strip()
-                if title.lower() == name.lower():
-                    start_line = i
-                    heading_level = len(match.group(1))
-                    break
+        for match in _HEADING.finditer(self.content):
+            title = match.group(2).strip()
+            if title.lower() == name.lower():
+                start_line = self._offset_to_line(match.start())
+                heading_level = len(match.group(1))
+                section_end = match.end()
+                break
 
         if not start_line:
             return super().extract_element(element_type, name)
 
         # Find the end of this section (next heading of same or higher level)
         end_line = len(self.lines)
-        for i in range(start_line, len(self.lines)):
-            line = self.lines[i]
-            match = re.match(r'^(#{1,6})\s+', line)
-            if match:
-                level = len(match.group(1))
-                if level <= heading_level:
-                    end_line = i
-                    break
+        for match in _HEADING_START.finditer(self.content, section_end):
+            if len(match.group(1)) <= heading_level:
+                end_line = self._offset_to_line(match.start()) - 1
+                break
 
         # Extract the section
         source = '\n'.join(self.lines[start_line-1:end_line])
@@ -2,9 +2,16 @@
 
 import json
 import re
-from typing import Dict, List, Any, Optional
+from json.decoder import scanstring
+from typing import Dict, List, Any, Optional, Tuple
 from ..base import FileAnalyzer, register
 
+# YAML top-level key (no indentation)
+_YAML_TOP_LEVEL_KEY = re.compile(r'^([a-zA-Z_][a-zA-Z0-9_-]*)[ \t]*:', re.MULTILINE)
+
+# JSON insignificant whitespace (RFC 8259)
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
 
 @register('.yaml', '.yml', name='YAML', icon='')
 class YamlAnalyzer(FileAnalyzer):
@@ -13,21 +20,42 @@ class YamlAnalyzer(FileAnalyzer):
     Extracts top-level keys.
     """
 
-    def get_structure(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Extract YAML top-level keys."""
+    def get_structure(self, head: int = None, tail: int = None,
+                      range: tuple = None, **kwargs) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract YAML top-level keys.
+
+        Args:
+            head: Show first N keys
+            tail: Show last N keys
+            range: Show keys in range (start, end) - 1-indexed
+            **kwargs: Additional parameters (unused)
+        """
+        keys = self._apply_semantic_slice(self._find_top_level_keys(), head, tail, range)
+        return {'keys': [{'line': line, 'name': name} for line, name in keys]}
+
+    def _find_top_level_keys(self) -> List[Tuple[int, str]]:
+        """Find top-level keys (no indentation) with one sweep over the content."""
+        return self._cached_parse('keys', self._scan_top_level_keys)
+
+    def _scan_top_level_keys(self) -> List[Tuple[int, str]]:
+        """Scan for top-level keys, counting lines between matches.
+
+        Top-level keys are sparse in large YAML files, so newlines between
+        consecutive matches are counted in C (str.count) rather than
+        building a line table for every line of the file.
+        """
+        content = self.content
         keys = []
+        line = 1
+        pos = 0
 
-        for i, line in enumerate(self.lines, 1):
-            # Match top-level key (no indentation)
-            match = re.match(r'^([a-zA-Z_][a-zA-Z0-9_-]*)\s*:', line)
-            if match:
-                key_name = match.group(1)
-                keys.append({
-                    'line': i,
-                    'name': key_name,
-                })
+        for match in _YAML_TOP_LEVEL_KEY.finditer(content):
+            start = match.start()
+            line += content.count('\n', pos, start)
+            pos = start
+            keys.append((line, match.group(1)))
 
-        return {'keys': keys}
+        return keys
 
     def extract_element(self, element_type: str, name: str) -> Optional[Dict[str, Any]]:
         """Extract a YAML key and its value.
@@ -39,26 +67,21 @@ class YamlAnalyzer(FileAnalyzer):
         Returns:
             Dict with key content
         """
-        # Find the key
-        start_line = None
+        keys = self._find_top_level_keys()
 
-        for i, line in enumerate(self.lines, 1):
-            match = re.match(r'^([a-zA-Z_][a-zA-Z0-9_-]*)\s*:', line)
-            if match and match.group(1) == name:
-                start_line = i
-                break
+        # Find the key
+        index = next((i for i, (_, key) in enumerate(keys) if key == name), None)
 
-        if not start_line:
+        if index is None:
             return super().extract_element(element_type, name)
 
-        # Find end of this key (next top-level key or end of file)
-        end_line = len(self.lines)
-        for i in range(start_line, len(self.lines)):
-            line = self.lines[i]
-            # Next top-level key?
-            if re.match(r'^[a-zA-Z_][a-zA-Z0-9_-]*\s*:', line):
-                end_line = i
-                break
+        start_line = keys[index][0]
+
+        # End of this key is the line before the next top-level key (or end of file)
+        if index + 1 < len(keys):
+            end_line = keys[index + 1][0] - 1
+        else:
+            end_line = len(self.lines)
 
         source = '\n'.join(self.lines[start_line-1:end_line])
 
@@ -77,34 +100,79 @@ class JsonAnalyzer(FileAnalyzer):
     Extracts top-level keys.
     """
 
-    def get_structure(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Extract JSON top-level keys."""
-        try:
-            data = json.loads(self.content)
-
-            if not isinstance(data, dict):
-                return {}
+    def get_structure(self, head: int = None, tail: int = None,
+                      range: tuple = None, **kwargs) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract JSON top-level keys.
 
-            keys = []
-            for key in data.keys():
-                # Find line number by searching
-                line_num = self._find_key_line(key)
-                keys.append({
-                    'line': line_num,
-                    'name': key,
-                })
+        Args:
+            head: Show first N keys
+            tail: Show last N keys
+            range: Show keys in range (start, end) - 1-indexed
+            **kwargs: Additional parameters (unused)
+        """
+        keys = self._cached_parse('keys', self._parse_keys)
+        if keys is None:
+            return {}
 
-            return {'keys': keys}
+        keys = self._apply_semantic_slice(keys, head, tail, range)
+        return {'keys': [{'line': line, 'name': name} for line, name in keys]}
 
+    def _parse_keys(self) -> Optional[List[Tuple[int, str]]]:
+        """Parse top-level keys, or None if not a valid JSON object."""
+        try:
+            return self._scan_top_level_keys()
         except json.JSONDecodeError:
-            return {}
+            return None
+
+    def _scan_top_level_keys(self) -> Optional[List[Tuple[int, str]]]:
+        """Walk the top-level object once, recording where each key starts.
 
-    def _find_key_line(self, key: str) -> int:
-        """Find line number where key is defined."""
-        pattern = rf'"{re.escape(key)}"\s*:'
+        Values are skipped with the C decoder (raw_decode), so the file is
+        validated and every key's position is known in a single pass.
 
-        for i, line in enumerate(self.lines, 1):
-            if re.search(pattern, line):
-                return i
+        Raises:
+            json.JSONDecodeError: If content is not valid JSON
+        """
+        content = self.content
+        decoder = json.JSONDecoder()
 
-        return 1  # Default to line 1
+        pos = _WHITESPACE.match(content, 0).end()
+        if content[pos:pos + 1] != '{':
+            return None  # Not an object (or empty) - no top-level keys
+
+        keys = []
+        seen = set()
+        pos = _WHITESPACE.match(content, pos + 1).end()
+
+        if content[pos:pos + 1] == '}':
+            pos += 1
+        else:
+            while True:
+                if content[pos:pos + 1] != '"':
+                    raise json.JSONDecodeError("Expecting property name", content, pos)
+                key_pos = pos
+                key, pos = scanstring(content, pos + 1)
+
+                pos = _WHITESPACE.match(content, pos).end()
+                if content[pos:pos + 1] != ':':
+                    raise json.JSONDecodeError("Expecting ':' delimiter", content, pos)
+                pos = _WHITESPACE.match(content, pos + 1).end()
+                _, pos = decoder.raw_decode(content, pos)
+
+                # Duplicate keys: keep the first definition's line
+                if key not in seen:
+                    seen.add(key)
+                    keys.append((self._offset_to_line(key_pos), key))
+
+                pos = _WHITESPACE.match(content, pos).end()
+                delimiter = content[pos:pos + 1]
+                pos = _WHITESPACE.match(content, pos + 1).end()
+                if delimiter == '}':
+                    break
+                if delimiter != ',':
+                    raise json.JSONDecodeError("Expecting ',' delimiter", content, pos)
+
+        if _WHITESPACE.match(content, pos).end() != len(content):
+            raise json.JSONDecodeError("Extra data", content, pos)
+
+        return keys
@@ -2,8 +2,11 @@
 
 import os
 import logging
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Iterable, IO, Union
 import hashlib
 
 logger = logging.getLogger(__name__)
@@ -12,6 +15,29 @@ logger = logging.getLogger(__name__)
 _TYPE_REGISTRY = None
 _RELATIONSHIP_REGISTRY = None
 
+# Parse results shared across analyzer instances (see FileAnalyzer._cached_parse)
+_PARSE_CACHE: 'OrderedDict[tuple, Any]' = OrderedDict()
+_PARSE_CACHE_SIZE = 256
+
+
+def decode_text(data: bytes, name: Any = None) -> str:
+    """Decode raw file bytes with automatic encoding detection.
+
+    UTF-8 is tried first; anything else is decoded as Latin-1, which maps
+    every byte to a character and so cannot fail. (UTF-8 with a BOM would
+    fail exactly where plain UTF-8 does, and cp1252 would never be reached
+    after Latin-1, so neither is worth a decode pass.)
+
+    Args:
+        data: Raw file content
+        name: File name, for debug logging only
+    """
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        logger.debug(f"Failed to decode {name} with utf-8, falling back to latin-1")
+        return data.decode('latin-1')
+
 
 def _get_type_system():
     """Lazy import of type system to avoid circular dependencies."""
@@ -52,10 +78,20 @@ class FileAnalyzer:
     types: Optional[Dict[str, Any]] = None
     relationships: Optional[Dict[str, Any]] = None
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, source: Optional[Union[str, bytes, IO]] = None):
+        """Load a file for analysis.
+
+        Args:
+            path: File path (also names the file for in-memory sources)
+            source: Optional in-memory content (str, bytes or a readable
+                file-like object) - skips reading path from disk
+        """
         self.path = Path(path)
-        self.lines = self._read_file()
+        self._in_memory = source is not None
+        self.lines = self._read_source(source) if self._in_memory else self._read_file()
         self.content = '\n'.join(self.lines)
+        self._line_starts = None  # Built on demand by _offset_to_line()
+        self._parsed: Dict[str, Any] = {}  # Per-instance memo for _cached_parse()
 
         # Initialize type system if types are defined
         self._type_registry = None
@@ -64,35 +100,39 @@ class FileAnalyzer:
 
     def _read_file(self) -> List[str]:
         """Read file with automatic encoding detection."""
-        encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']
-
-        for encoding in encodings:
-            try:
-                with open(self.path, 'r', encoding=encoding) as f:
-                    return f.read().splitlines()
-            except (UnicodeDecodeError, LookupError):
-                # Try next encoding
-                logger.debug(f"Failed to read {self.path} with {encoding}, trying next")
-                continue
-
-        # Last resort: read as binary and decode with errors='replace'
-        logger.debug(f"All encodings failed for {self.path}, using binary mode with error replacement")
         with open(self.path, 'rb') as f:
-            content = f.read().decode('utf-8', errors='replace')
-            return content.splitlines()
+            return self._decode(f.read()).splitlines()
+
+    def _read_source(self, source: Union[str, bytes, IO]) -> List[str]:
+        """Read in-memory content (str, bytes or file-like object)."""
+        if hasattr(source, 'read'):
+            source = source.read()
+        if isinstance(source, bytes):
+            self._source_size = len(source)
+            source = self._decode(source)
+        else:
+            self._source_size = len(source.encode('utf-8'))
+        return source.splitlines()
+
+    def _decode(self, data: bytes) -> str:
+        """Decode raw bytes with automatic encoding detection."""
+        return decode_text(data, self.path)
 
     def get_metadata(self) -> Dict[str, Any]:
         """Return file metadata.
 
         Automatic - works for all file types.
         """
-        stat = os.stat(self.path)
+        if self._in_memory:
+            size = self._source_size
+        else:
+            size = os.stat(self.path).st_size
 
         return {
             'path': str(self.path),
             'name': self.path.name,
-            'size': stat.st_size,
-            'size_human': self._format_size(stat.st_size),
+            'size': size,
+            'size_human': self._format_size(size),
             'lines': len(self.lines),
             'encoding': self._detect_encoding(),
         }
@@ -115,13 +155,57 @@ class FileAnalyzer:
         """
         return {}
 
-    def _apply_semantic_slice(self, items: List[Dict[str, Any]],
+    def _cached_parse(self, name: str, parse: Callable[[], Any]) -> Any:
+        """Memoize an expensive parse across analyzer instances.
+
+        Results are keyed by (analyzer class, name, path, mtime, size), so
+        repeated analysis of an unchanged file (e.g. several head/tail/range
+        views) parses it once. Repeat calls on the same instance are served
+        from memory without even a stat(). Treat the returned value as
+        read-only.
+
+        Args:
+            name: Identifies the parse within the analyzer (e.g. 'keys')
+            parse: Computes the result from this instance's content
+
+        Returns:
+            Cached or freshly computed parse result
+        """
+        if name in self._parsed:
+            return self._parsed[name]
+
+        # In-memory content has no file identity to key the shared cache on
+        if self._in_memory:
+            result = self._parsed[name] = parse()
+            return result
+
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            result = self._parsed[name] = parse()
+            return result
+
+        key = (type(self), name, os.path.abspath(self.path), stat.st_mtime_ns, stat.st_size)
+        if key in _PARSE_CACHE:
+            _PARSE_CACHE.move_to_end(key)
+            result = _PARSE_CACHE[key]
+        else:
+            result = parse()
+            _PARSE_CACHE[key] = result
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+
+        self._parsed[name] = result
+        return result
+
+    def _apply_semantic_slice(self, items: Iterable[Dict[str, Any]],
                               head: int = None, tail: int = None,
                               range: tuple = None) -> List[Dict[str, Any]]:
         """Apply head/tail/range slicing to a list of semantic units.
 
         Args:
-            items: List of semantic units (records, functions, sections, etc.)
+            items: Semantic units (records, functions, sections, etc.) -
+                a list, or any iterable such as a generator of parsed records
             head: Show first N units
             tail: Show last N units
             range: Show units in range (start, end) - 1-indexed
@@ -130,21 +214,35 @@ class FileAnalyzer:
             Sliced list of items
 
         This is a shared helper that all analyzers can use to implement
-        semantic navigation consistently.
+        semantic navigation consistently. Lists are sliced directly; other
+        iterables are consumed lazily, so head/range stop after the last
+        wanted unit and tail keeps only N units in memory. Without any
+        slicing, a list is returned as-is rather than copied.
         """
-        if not items:
-            return items
+        if head is None and tail is None and range is None:
+            return items if isinstance(items, list) else list(items)
+
+        if isinstance(items, list):
+            if not items:
+                return items
+
+            if head is not None:
+                return items[:head]
+            elif tail is not None:
+                return items[-tail:]
+            else:
+                start, end = range
+                # Convert 1-indexed to 0-indexed, inclusive range
+                return items[start-1:end]
 
         if head is not None:
-            return items[:head]
+            return list(islice(items, head))
         elif tail is not None:
-            return items[-tail:]
-        elif range is not None:
+            return list(deque(items, maxlen=tail))
+        else:
             start, end = range
             # Convert 1-indexed to 0-indexed, inclusive range
-            return items[start-1:end]
-        else:
-            return items
+            return list(islice(items, max(start - 1, 0), end))
 
     def extract_element(self, element_type: str, name: str) -> Optional[Dict[str, Any]]:
         """Extract a specific element from the file.
@@ -178,6 +276,19 @@ class FileAnalyzer:
                 }
         return None
 
+    def _offset_to_line(self, offset: int) -> int:
+        """Map an offset in self.content to its 1-indexed line number.
+
+        Lets analyzers scan self.content in one pass and resolve line
+        numbers afterwards, instead of re-scanning self.lines per item.
+        """
+        if self._line_starts is None:
+            # Running sum of len(line) + 1 ('\n'); accumulate does the summing
+            # in C, ~25% faster than appending in a Python loop
+            line_lengths = [len(line) + 1 for line in self.lines[:-1]]
+            self._line_starts = list(accumulate(line_lengths, initial=0))
+        return bisect_right(self._line_starts, offset)
+
     def format_with_lines(self, source: str, start_line: int) -> str:
         """Format source code with line numbers.
 
@@ -474,12 +585,11 @@ def _try_treesitter_fallback(ext: str) -> Optional[type]:
         return None
 
     try:
-        # Test if parser is available
-        from tree_sitter_languages import get_parser
-        get_parser(language)
-
         # Import TreeSitterAnalyzer dynamically to avoid circular import
-        from .treesitter import TreeSitterAnalyzer
+        from .treesitter import TreeSitterAnalyzer, _get_parser
+
+        # Test if parser is available (cached for the analyzer to reuse)
+        _get_parser(language)
 
         # Create dynamic analyzer class
         class_name = f'Dynamic{language.title().replace("_", "")}Analyzer'
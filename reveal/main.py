@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Optional, Dict, List, Any
 from datetime import datetime, timedelta
 from .base import get_analyzer, get_all_analyzers, FileAnalyzer
-from .tree_view import show_directory_tree
+from .tree_view import iter_directory_tree
 from . import __version__
 
 
@@ -886,10 +886,10 @@ def _main_impl():
 
     # Route based on path type
     if path.is_dir():
-        # Directory → show tree
-        output = show_directory_tree(str(path), depth=args.depth,
-                                     max_entries=args.max_entries, fast=args.fast)
-        print(output)
+        # Directory → show tree (printed as it is walked)
+        for line in iter_directory_tree(str(path), depth=args.depth,
+                                        max_entries=args.max_entries, fast=args.fast):
+            print(line)
 
     elif path.is_file():
         # File → show structure or extract element
@@ -1278,12 +1278,30 @@ def _format_code_blocks(items: List[Dict[str, Any]], path: Path, output_format:
 
 def _format_standard_items(items: List[Dict[str, Any]], path: Path, output_format: str) -> None:
     """Format and display standard items (functions, classes, etc.)."""
+    grep = output_format == 'grep'
+
+    # Specialize the location prefix once per call instead of branching per item
+    path_str = str(path)
+    location_format = "{}:{}:" if grep else "  {}:{:<6} "
+
     for item in items:
         line = item.get('line', '?')
         name = item.get('name', '')
-        signature = item.get('signature', '')
         content = item.get('content', '')
 
+        # Format based on what's available
+        if name:
+            text = f"{name}{item.get('signature') or ''}"
+        elif content:
+            print(f"{location_format.format(path_str, line)}{content}")
+            continue
+        else:
+            continue
+
+        if grep:
+            print(f"{location_format.format(path_str, line)}{text}")
+            continue
+
         # Build metrics display (if available)
         metrics = ''
         if 'line_count' in item or 'depth' in item:
@@ -1295,22 +1313,7 @@ def _format_standard_items(items: List[Dict[str, Any]], path: Path, output_forma
             if parts:
                 metrics = f" [{', '.join(parts)}]"
 
-        # Format based on what's available
-        if signature and name:
-            if output_format == 'grep':
-                print(f"{path}:{line}:{name}{signature}")
-            else:
-                print(f"  {path}:{line:<6} {name}{signature}{metrics}")
-        elif name:
-            if output_format == 'grep':
-                print(f"{path}:{line}:{name}")
-            else:
-                print(f"  {path}:{line:<6} {name}{metrics}")
-        elif content:
-            if output_format == 'grep':
-                print(f"{path}:{line}:{content}")
-            else:
-                print(f"  {path}:{line:<6} {content}")
+        print(f"{location_format.format(path_str, line)}{text}{metrics}")
 
 
 def _build_analyzer_kwargs(analyzer: FileAnalyzer, args) -> Dict[str, Any]:
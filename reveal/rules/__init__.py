@@ -5,6 +5,7 @@ Industry-aligned pattern detection following Ruff, ESLint, and Semgrep patterns.
 
 import importlib
 import logging
+import sys
 from pathlib import Path
 from typing import List, Type, Optional, Dict, Any
 
@@ -240,6 +241,9 @@ class RuleRegistry:
         rules = cls.get_rules(select=select, ignore=ignore)
         detections = []
 
+        # Every detection for this file shares one path string
+        file_path = sys.intern(str(file_path))
+
         for rule_class in rules:
             # Check if rule applies to this file
             if not rule_class().matches_target(file_path):
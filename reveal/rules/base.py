@@ -8,7 +8,22 @@ from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 from pathlib import Path
+from bisect import bisect_right
+from functools import lru_cache
+import ast
 import re
+import sys
+
+_NEWLINE = re.compile(r'\n')
+
+
+@lru_cache(maxsize=1)
+def _parse_python(content: str, file_path: str) -> ast.AST:
+    """Parse Python source once per file, shared by all AST-based rules.
+
+    Rules check one file at a time, so only the latest tree is kept.
+    """
+    return ast.parse(content, filename=file_path)
 
 
 class Severity(Enum):
@@ -101,6 +116,15 @@ class RulePrefix(Enum):
     # R9xx: General code smells (too many args, too many locals, etc.)
 
 
+# Terminal markers per severity (used by Detection.__str__)
+_SEVERITY_MARKERS: Dict[Severity, str] = {
+    Severity.LOW: "ℹ️ ",
+    Severity.MEDIUM: "⚠️ ",
+    Severity.HIGH: "❌",
+    Severity.CRITICAL: "🚨"
+}
+
+
 @dataclass
 class Detection:
     """
@@ -130,15 +154,10 @@ class Detection:
 
     def __str__(self) -> str:
         """Format for terminal output (Ruff-style)."""
-        loc = f"{self.file_path}:{self.line}:{self.column}"
-        severity_marker = {
-            Severity.LOW: "ℹ️ ",
-            Severity.MEDIUM: "⚠️ ",
-            Severity.HIGH: "❌",
-            Severity.CRITICAL: "🚨"
-        }.get(self.severity, "")
-
-        result = f"{loc} {severity_marker} {self.rule_code} {self.message}"
+        severity_marker = _SEVERITY_MARKERS.get(self.severity, "")
+
+        result = (f"{self.file_path}:{self.line}:{self.column} "
+                  f"{severity_marker} {self.rule_code} {self.message}")
         if self.suggestion:
             result += f"\n  💡 {self.suggestion}"
         if self.context:
@@ -248,11 +267,14 @@ class BaseRule(ABC):
                 context=context
             )
         """
+        # Intern the strings repeated across many detections (custom messages
+        # are usually unique, so only the rule default is interned). The
+        # registry already interns file_path, which may also be a Path here.
         return Detection(
             file_path=file_path,
             line=line,
-            rule_code=self.code,
-            message=message or self.message,
+            rule_code=sys.intern(self.code),
+            message=message or sys.intern(self.message),
             column=column,
             suggestion=suggestion,
             context=context,
@@ -260,6 +282,48 @@ class BaseRule(ABC):
             category=self.category
         )
 
+    @staticmethod
+    def parse_python(content: str, file_path: str) -> ast.AST:
+        """
+        Get the Python AST for a file.
+
+        The parse is cached, so rules checking the same file (B001, R913, ...)
+        share one tree instead of each calling ast.parse(). The tree is
+        shared: rules must not mutate it.
+
+        Raises:
+            SyntaxError: If content is not valid Python
+        """
+        return _parse_python(content, file_path)
+
+    @staticmethod
+    def get_line_starts(content: str) -> List[int]:
+        """
+        Build the offset table of line starts for a file.
+
+        Lets rules scan the whole content with a single regex pass and map
+        match offsets back to line numbers, instead of splitting into lines.
+
+        Args:
+            content: File content
+
+        Returns:
+            List where index i holds the offset of line i + 1
+        """
+        return [0] + [m.end() for m in _NEWLINE.finditer(content)]
+
+    @staticmethod
+    def get_line_number(line_starts: List[int], offset: int) -> int:
+        """Map a content offset to its 1-indexed line number."""
+        return bisect_right(line_starts, offset)
+
+    @staticmethod
+    def get_line_text(content: str, line_starts: List[int], line: int) -> str:
+        """Get the text of a 1-indexed line (without line terminator)."""
+        start = line_starts[line - 1]
+        end = line_starts[line] - 1 if line < len(line_starts) else len(content)
+        return content[start:end].rstrip('\r')
+
     def matches_target(self, target: str) -> bool:
         """
         Check if this rule applies to target (file or URI).
@@ -31,7 +31,7 @@ class B001(BaseRule):
 
         Args:
             file_path: Path to Python file
-            structure: Parsed structure (not used, we parse AST ourselves)
+            structure: Parsed structure (not used, we use the shared AST)
             content: File content
 
         Returns:
@@ -39,25 +39,27 @@ class B001(BaseRule):
         """
         detections = []
 
+        # Cheap pre-filter: no 'except' token means no bare except is possible
+        if 'except' not in content:
+            return detections
+
         try:
-            tree = ast.parse(content, filename=file_path)
+            tree = self.parse_python(content, file_path)
         except SyntaxError as e:
             logger.debug(f"Syntax error in {file_path}, skipping B001 check: {e}")
             return detections
 
+        line_starts = None  # Built on the first detection only
+
         # Walk the AST looking for bare except handlers
         for node in ast.walk(tree):
             if isinstance(node, ast.ExceptHandler):
                 # Bare except has type=None
                 if node.type is None:
-                    # Get context (the except line)
-                    try:
-                        context = ast.get_source_segment(content, node)
-                        if context:
-                            # Just show first line of context
-                            context = context.split('\n')[0]
-                    except Exception:
-                        context = None
+                    # Context is the except line itself
+                    if line_starts is None:
+                        line_starts = self.get_line_starts(content)
+                    context = self.get_line_text(content, line_starts, node.lineno).strip()
 
                     detections.append(self.create_detection(
                         file_path=file_path,
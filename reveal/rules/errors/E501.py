@@ -4,6 +4,7 @@ Detects lines that exceed the maximum line length (PEP 8 style).
 Universal rule that works on any text file.
 """
 
+import re
 import logging
 from typing import List, Dict, Any, Optional
 
@@ -34,6 +35,9 @@ class E501(BaseRule):
         '# type:',  # Type comments
     ]
 
+    # Lines whose raw length exceeds the limit (candidates for E501)
+    LONG_LINE_PATTERN = re.compile(r'[^\r\n]{%d,}' % (MAX_LENGTH + 1))
+
     def check(self,
              file_path: str,
              structure: Optional[Dict[str, Any]],
@@ -50,9 +54,12 @@ class E501(BaseRule):
             List of detections
         """
         detections = []
-        lines = content.splitlines()
+        line_starts = None
+
+        # Only lines longer than the limit can fire; let the regex find them
+        for match in self.LONG_LINE_PATTERN.finditer(content):
+            line = match.group(0)
 
-        for i, line in enumerate(lines, start=1):
             # Skip if line contains ignore patterns
             if any(pattern in line for pattern in self.IGNORE_PATTERNS):
                 continue
@@ -63,9 +70,12 @@ class E501(BaseRule):
             if line_length > self.MAX_LENGTH:
                 excess = line_length - self.MAX_LENGTH
 
+                if line_starts is None:
+                    line_starts = self.get_line_starts(content)
+
                 detections.append(Detection(
                     file_path=file_path,
-                    line=i,
+                    line=self.get_line_number(line_starts, match.start()),
                     rule_code=self.code,
                     message=f"{self.message} ({line_length} > {self.MAX_LENGTH} characters, {excess} over)",
                     column=self.MAX_LENGTH + 1,
@@ -25,6 +25,14 @@ class R913(BaseRule):
     # Threshold for "too many" (configurable in future)
     MAX_ARGS = 5
 
+    # Same for every detection, so built once with the class
+    SUGGESTION = (
+        f"Reduce to {MAX_ARGS} or fewer arguments. "
+        f"Consider: 1) Using a config object/dataclass, "
+        f"2) Breaking function into smaller pieces, "
+        f"3) Using **kwargs for optional params"
+    )
+
     def check(self,
              file_path: str,
              structure: Optional[Dict[str, Any]],
@@ -34,7 +42,7 @@ class R913(BaseRule):
 
         Args:
             file_path: Path to Python file
-            structure: Parsed structure (not used, we parse AST ourselves)
+            structure: Parsed structure (not used, we use the shared AST)
             content: File content
 
         Returns:
@@ -42,12 +50,18 @@ class R913(BaseRule):
         """
         detections = []
 
+        # Cheap pre-filter: no function definitions means nothing to check
+        if 'def ' not in content and 'def\t' not in content:
+            return detections
+
         try:
-            tree = ast.parse(content, filename=file_path)
+            tree = self.parse_python(content, file_path)
         except SyntaxError as e:
             logger.debug(f"Syntax error in {file_path}, skipping R913 check: {e}")
             return detections
 
+        line_starts = None  # Built on the first detection only
+
         # Walk the AST looking for function definitions
         for node in ast.walk(tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -70,28 +84,20 @@ class R913(BaseRule):
                     if args.kwonlyargs:
                         arg_names.extend([a.arg for a in args.kwonlyargs])
 
-                    # Get the function signature as context
-                    try:
-                        context = ast.get_source_segment(content, node)
-                        if context:
-                            # Just show the def line
-                            context = context.split('\n')[0]
-                    except Exception:
+                    # Context is the def line itself
+                    if line_starts is None:
+                        line_starts = self.get_line_starts(content)
+                    if node.lineno <= len(line_starts):
+                        context = self.get_line_text(content, line_starts, node.lineno).strip()
+                    else:
                         context = f"def {node.name}(...)"
 
-                    suggestion = (
-                        f"Reduce to {self.MAX_ARGS} or fewer arguments. "
-                        f"Consider: 1) Using a config object/dataclass, "
-                        f"2) Breaking function into smaller pieces, "
-                        f"3) Using **kwargs for optional params"
-                    )
-
                     detections.append(self.create_detection(
                         file_path=file_path,
                         line=node.lineno,
                         message=f"{self.message} ({total_args} > {self.MAX_ARGS}): {node.name}()",
                         column=node.col_offset + 1,
-                        suggestion=suggestion,
+                        suggestion=self.SUGGESTION,
                         context=context
                     ))
 
@@ -28,13 +28,13 @@ class S701(BaseRule):
 
     # Pattern to match FROM lines with :latest
     LATEST_PATTERN = re.compile(
-        r'^\s*FROM\s+(\S+):latest',
+        r'^[ \t]*FROM[ \t]+(\S+):latest',
         re.IGNORECASE | re.MULTILINE
     )
 
     # Pattern to match FROM lines without any tag (also problematic)
     NO_TAG_PATTERN = re.compile(
-        r'^\s*FROM\s+([a-zA-Z0-9_/-]+)\s*(?:#|$)',
+        r'^[ \t]*FROM[ \t]+([a-zA-Z0-9_/-]+)[ \t\r]*(?:#|$)',
         re.IGNORECASE | re.MULTILINE
     )
 
@@ -61,44 +61,47 @@ class S701(BaseRule):
     def _check_file(self, file_path: str, content: str) -> List[Detection]:
         """Check Dockerfile content for :latest usage."""
         detections = []
-        lines = content.splitlines()
 
-        for i, line in enumerate(lines, start=1):
-            # Check for explicit :latest
-            match = re.match(r'^\s*FROM\s+(\S+):latest', line, re.IGNORECASE)
-            if match:
-                image = match.group(1)
+        # Explicit :latest and missing tag (defaults to :latest) never match the same line
+        matches = list(self.LATEST_PATTERN.finditer(content))
+        matches.extend(self.NO_TAG_PATTERN.finditer(content))
+        if not matches:
+            return detections
+        matches.sort(key=lambda m: m.start())
+
+        line_starts = self.get_line_starts(content)
+
+        for match in matches:
+            line = self.get_line_number(line_starts, match.start())
+            line_text = self.get_line_text(content, line_starts, line)
+            image = match.group(1)
+
+            if match.re is self.LATEST_PATTERN:
                 detections.append(Detection(
                     file_path=file_path,
-                    line=i,
+                    line=line,
                     rule_code=self.code,
                     message=f"{self.message}: {image}:latest",
                     column=1,
                     suggestion=f"Pin to specific version: FROM {image}:1.0.0",
-                    context=line.strip(),
+                    context=line_text.strip(),
                     severity=self.severity,
                     category=self.category
                 ))
 
-            # Check for missing tag (defaults to :latest)
-            elif re.match(r'^\s*FROM\s+[a-zA-Z0-9_/-]+\s*(?:#|$)', line, re.IGNORECASE):
-                # Extract image name
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    image = parts[1]
-                    # Skip multi-stage builds (FROM ... AS ...)
-                    if 'AS' not in line.upper():
-                        detections.append(Detection(
-                            file_path=file_path,
-                            line=i,
-                            rule_code=self.code,
-                            message=f"Docker image missing tag (defaults to :latest): {image}",
-                            column=1,
-                            suggestion=f"Pin to specific version: FROM {image}:1.0.0",
-                            context=line.strip(),
-                            severity=self.severity,
-                            category=self.category
-                        ))
+            # Skip multi-stage builds (FROM ... AS ...)
+            elif 'AS' not in line_text.upper():
+                detections.append(Detection(
+                    file_path=file_path,
+                    line=line,
+                    rule_code=self.code,
+                    message=f"Docker image missing tag (defaults to :latest): {image}",
+                    column=1,
+                    suggestion=f"Pin to specific version: FROM {image}:1.0.0",
+                    context=line_text.strip(),
+                    severity=self.severity,
+                    category=self.category
+                ))
 
         return detections
 
@@ -58,29 +58,33 @@ class U501(BaseRule):
     def _check_file(self, file_path: str, content: str) -> List[Detection]:
         """Check file content for insecure GitHub URLs."""
         detections = []
-        lines = content.splitlines()
-
-        for i, line in enumerate(lines, start=1):
-            # Find all GitHub URLs with http://
-            matches = list(self.GITHUB_HTTP_PATTERN.finditer(line))
-            matches.extend(self.GITHUB_SUBDOMAIN_PATTERN.finditer(line))
-
-            for match in matches:
-                insecure_url = match.group(0)
-                secure_url = insecure_url.replace('http://', 'https://')
-                column = match.start() + 1  # 1-indexed
-
-                detections.append(Detection(
-                    file_path=file_path,
-                    line=i,
-                    rule_code=self.code,
-                    message=f"{self.message}: {insecure_url}",
-                    column=column,
-                    suggestion=f"Use HTTPS: {secure_url}",
-                    context=line.strip(),
-                    severity=self.severity,
-                    category=self.category
-                ))
+
+        # Scan the whole content once per pattern, then order by position
+        matches = list(self.GITHUB_HTTP_PATTERN.finditer(content))
+        matches.extend(self.GITHUB_SUBDOMAIN_PATTERN.finditer(content))
+        if not matches:
+            return detections
+        matches.sort(key=lambda m: m.start())
+
+        line_starts = self.get_line_starts(content)
+
+        for match in matches:
+            insecure_url = match.group(0)
+            secure_url = insecure_url.replace('http://', 'https://')
+            line = self.get_line_number(line_starts, match.start())
+            column = match.start() - line_starts[line - 1] + 1  # 1-indexed
+
+            detections.append(Detection(
+                file_path=file_path,
+                line=line,
+                rule_code=self.code,
+                message=f"{self.message}: {insecure_url}",
+                column=column,
+                suggestion=f"Use HTTPS: {secure_url}",
+                context=self.get_line_text(content, line_starts, line).strip(),
+                severity=self.severity,
+                category=self.category
+            ))
 
         return detections
 
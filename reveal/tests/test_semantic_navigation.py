@@ -91,7 +91,20 @@ class TestSemanticSliceHelper(unittest.TestCase):
         """Test with no arguments - returns all items."""
         result = self.analyzer._apply_semantic_slice(self.items)
         self.assertEqual(len(result), 10)
-        self.assertEqual(result, self.items)
+        self.assertIs(result, self.items)
+
+    def test_generator_input(self):
+        """Test slicing a lazily-produced iterable."""
+        self.assertEqual(
+            [i['name'] for i in self.analyzer._apply_semantic_slice(iter(self.items), head=2)],
+            ['item1', 'item2'])
+        self.assertEqual(
+            [i['name'] for i in self.analyzer._apply_semantic_slice(iter(self.items), tail=2)],
+            ['item9', 'item10'])
+        self.assertEqual(
+            [i['name'] for i in self.analyzer._apply_semantic_slice(iter(self.items), range=(3, 4))],
+            ['item3', 'item4'])
+        self.assertEqual(len(self.analyzer._apply_semantic_slice(iter(self.items))), 10)
 
     def test_empty_list(self):
         """Test slicing empty list."""
@@ -270,6 +283,15 @@ class TestMarkdownAnalyzerNavigation(unittest.TestCase):
         self.assertIn('Heading 4', structure['headings'][0]['name'])
         self.assertIn('Heading 6', structure['headings'][2]['name'])
 
+    def test_in_memory_source(self):
+        """Test navigation on content passed in memory (no file on disk)."""
+        content = ''.join(f"# Heading {i}\n\nText.\n\n" for i in range(1, 6))
+        analyzer = MarkdownAnalyzer('notes.md', source=content)
+
+        structure = analyzer.get_structure(tail=2)
+        self.assertEqual([h['name'] for h in structure['headings']], ['Heading 4', 'Heading 5'])
+        self.assertEqual(structure['headings'][0]['line'], 13)
+
     def test_navigation_with_links_extraction(self):
         """Test that navigation works with link extraction enabled."""
         # Add some links to test file
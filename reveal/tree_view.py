@@ -1,9 +1,32 @@
 """Directory tree view for reveal."""
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
-from .base import get_analyzer
+from typing import Iterator, List, Optional, Union
+from .base import get_analyzer, decode_text
+
+# Trees with more entries than this get a warning when output is limited
+_LARGE_DIRECTORY = 500
+
+# Tree connectors: (entry connector, child prefix) for middle and last entries
+_BRANCH = ('├── ', '│   ')
+_LAST_BRANCH = ('└── ', '    ')
+
+# Files shown by size only: binary formats no analyzer handles (skips the
+# analyzer lookup, which may resolve the path and read a shebang line),
+# and files too large to read just to count lines
+_BINARY_EXTENSIONS = frozenset({
+    '.pyc', '.pyo', '.so', '.dll', '.dylib', '.exe', '.o', '.a', '.class', '.jar',
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp',
+    '.pdf', '.zip', '.tar', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.whl',
+    '.mp3', '.mp4', '.wav', '.mov', '.woff', '.woff2', '.ttf', '.otf',
+})
+_MAX_LINE_COUNT_SIZE = 10 * 1024 * 1024
+
+# Bytes that str.splitlines() treats as line breaks besides '\n'
+_OTHER_LINE_BREAKS = re.compile(rb'[\r\v\f\x1c-\x1e]')
 
 
 def show_directory_tree(path: str, depth: int = 3, show_hidden: bool = False,
@@ -20,124 +43,189 @@ def show_directory_tree(path: str, depth: int = 3, show_hidden: bool = False,
     Returns:
         Formatted tree string
     """
+    return '\n'.join(iter_directory_tree(path, depth, show_hidden, max_entries, fast))
+
+
+def iter_directory_tree(path: str, depth: int = 3, show_hidden: bool = False,
+                        max_entries: int = 200, fast: bool = False) -> Iterator[str]:
+    """Yield the lines of show_directory_tree() as they are produced.
+
+    With max_entries=0 (unlimited) entries stream straight from the walk,
+    so huge trees can be printed incrementally. With a limit, the (at most
+    max_entries) entry lines are buffered because the large-directory
+    warning that precedes them needs the total from the walk.
+    """
     path = Path(path)
 
     if not path.is_dir():
-        return f"Error: {path} is not a directory"
+        yield f"Error: {path} is not a directory"
+        return
 
-    # Count total entries first for warnings
-    total_entries = _count_entries(path, depth, show_hidden)
+    yield f"{path.name or path}/\n"
 
-    lines = [f"{path.name or path}/\n"]
+    with ThreadPoolExecutor() as executor:
+        # Track how many entries we've shown (and seen, for the warning)
+        context = {'count': 0, 'max_entries': max_entries, 'truncated': 0, 'total': 0,
+                   'executor': None if fast else executor}
+        lines = _walk_directory(str(path), depth=depth, show_hidden=show_hidden,
+                                fast=fast, context=context)
 
-    # Warn if directory is large and user hasn't disabled limits
-    if total_entries > 500 and max_entries > 0:
-        lines.append(f"⚠️  Large directory detected ({total_entries} entries)")
-        lines.append(f"   Showing first {max_entries} entries (use --max-entries 0 for unlimited)")
-        if not fast:
-            lines.append(f"   Consider using --fast to skip line counting for better performance\n")
+        if max_entries > 0:
+            lines = list(lines)
 
-    # Track how many entries we've shown
-    context = {'count': 0, 'max_entries': max_entries, 'truncated': 0}
-    _walk_directory(path, lines, depth=depth, show_hidden=show_hidden,
-                   fast=fast, context=context)
+            # Warn if directory is large and user hasn't disabled limits
+            total_entries = context['total']
+            if total_entries > _LARGE_DIRECTORY:
+                # Counting of unshown subtrees stops once past the threshold
+                if context.get('partial_total'):
+                    total_entries = f"{total_entries}+"
+                yield f"⚠️  Large directory detected ({total_entries} entries)"
+                yield f"   Showing first {max_entries} entries (use --max-entries 0 for unlimited)"
+                if not fast:
+                    yield f"   Consider using --fast to skip line counting for better performance\n"
+
+        yield from lines
 
     # Show truncation message if we hit the limit
     if context['truncated'] > 0:
-        lines.append(f"\n... {context['truncated']} more entries (use --max-entries 0 to show all)")
+        yield f"\n... {context['truncated']} more entries (use --max-entries 0 to show all)"
 
     # Add navigation hint
-    lines.append(f"\nUsage: reveal {path}/<file>")
+    yield f"\nUsage: reveal {path}/<file>"
+
+
+def _scan(path: Union[str, os.DirEntry]) -> List[os.DirEntry]:
+    """List a directory with os.scandir.
+
+    DirEntry caches the file type from readdir (and stat() after the first
+    call), so is_dir()/is_file()/stat() on the results avoid extra syscalls.
+    """
+    with os.scandir(path) as it:
+        return list(it)
 
-    return '\n'.join(lines)
 
+def _count_entries(path: Union[str, os.DirEntry], depth: int, show_hidden: bool,
+                   limit: Optional[int] = None) -> int:
+    """Count total entries in directory tree (fast, no analysis).
 
-def _count_entries(path: Path, depth: int, show_hidden: bool) -> int:
-    """Count total entries in directory tree (fast, no analysis)."""
+    With a limit, counting stops once it is reached, so the result is only
+    exact when it is below the limit.
+    """
     if depth <= 0:
         return 0
 
-    try:
-        entries = list(path.iterdir())
-    except PermissionError:
-        return 0
+    top = os.fspath(path)
+    remaining_depth = {top: depth}  # Depth left below each directory visited
+    count = 0
 
-    if not show_hidden:
-        entries = [e for e in entries if not e.name.startswith('.')]
+    # os.walk scans with scandir and iterates instead of recursing; like the
+    # tree walk, it follows directory symlinks and skips unreadable dirs
+    for root, dirs, files in os.walk(top, followlinks=True):
+        if not show_hidden:
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            files = [f for f in files if not f.startswith('.')]
+        count += len(dirs) + len(files)
 
-    count = len(entries)
-    for entry in entries:
-        if entry.is_dir():
-            count += _count_entries(entry, depth - 1, show_hidden)
+        if limit is not None and count >= limit:
+            break
+
+        child_depth = remaining_depth.pop(root) - 1
+        if child_depth <= 0:
+            dirs[:] = []  # Prune: don't descend past the depth limit
+        for d in dirs:
+            remaining_depth[os.path.join(root, d)] = child_depth
 
     return count
 
 
-def _walk_directory(path: Path, lines: List[str], prefix: str = '', depth: int = 3,
-                   show_hidden: bool = False, fast: bool = False, context: dict = None):
-    """Recursively walk directory and build tree.
+def _walk_directory(path: Union[str, os.DirEntry], prefix: str = '', depth: int = 3,
+                    show_hidden: bool = False, fast: bool = False,
+                    context: dict = None) -> Iterator[str]:
+    """Recursively walk directory, yielding tree lines.
 
     Args:
         path: Directory to walk
-        lines: Output lines list
         prefix: Tree prefix for indentation
         depth: Remaining depth
         show_hidden: Show hidden files
         fast: Skip expensive operations
-        context: Shared context dict with 'count', 'max_entries', 'truncated'
+        context: Shared context dict with 'count', 'max_entries', 'truncated',
+            'total' (entries within depth, including truncated ones) and an
+            optional 'executor' that reads file info in parallel
     """
     if depth <= 0:
         return
 
     if context is None:
-        context = {'count': 0, 'max_entries': 0, 'truncated': 0}
+        context = {'count': 0, 'max_entries': 0, 'truncated': 0, 'total': 0}
 
     try:
-        entries = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name))
+        entries = _scan(path)
     except PermissionError:
         return
 
-    # Filter hidden files/dirs
+    # Filter hidden files/dirs (before sorting, so they are never type-checked)
     if not show_hidden:
         entries = [e for e in entries if not e.name.startswith('.')]
 
+    # Directories first; is_dir() reuses the type cached on each DirEntry
+    entries.sort(key=lambda e: (not e.is_dir(), e.name))
+
+    context['total'] += len(entries)
+    max_entries = context['max_entries']
+
+    # Read info for the files that can still be shown in parallel; the
+    # file reads are I/O bound and release the GIL. Lines stay in order.
+    pending = {}
+    executor = context.get('executor')
+    if executor is not None:
+        shown = entries
+        if max_entries > 0:
+            shown = entries[:max(max_entries - context['count'], 0)]
+        pending = {i: executor.submit(_get_file_info, entry, fast)
+                   for i, entry in enumerate(shown) if entry.is_file()}
+
+    last = len(entries) - 1
     for i, entry in enumerate(entries):
         # Check if we've hit the entry limit
-        if context['max_entries'] > 0 and context['count'] >= context['max_entries']:
-            # Count remaining entries
+        if max_entries > 0 and context['count'] >= max_entries:
+            # Count remaining entries; subtrees we won't walk are only counted,
+            # and only until the total is known to be over the warning threshold
             context['truncated'] += len(entries) - i
+            for remaining in entries[i:]:
+                if context['total'] > _LARGE_DIRECTORY:
+                    context['partial_total'] = True
+                    break
+                if remaining.is_dir():
+                    context['total'] += _count_entries(
+                        remaining, depth - 1, show_hidden,
+                        limit=_LARGE_DIRECTORY + 1 - context['total'])
             return
 
-        is_last = (i == len(entries) - 1)
-
         # Tree characters
-        if is_last:
-            connector = '└── '
-            extension = '    '
-        else:
-            connector = '├── '
-            extension = '│   '
+        connector, extension = _LAST_BRANCH if i == last else _BRANCH
 
         if entry.is_file():
             # Show file with metadata
-            file_info = _get_file_info(entry, fast=fast)
-            lines.append(f"{prefix}{connector}{file_info}")
+            future = pending.get(i)
+            file_info = future.result() if future else _get_file_info(entry, fast=fast)
+            yield f"{prefix}{connector}{file_info}"
             context['count'] += 1
 
         elif entry.is_dir():
             # Show directory
-            lines.append(f"{prefix}{connector}{entry.name}/")
+            yield f"{prefix}{connector}{entry.name}/"
             context['count'] += 1
             # Recurse into subdirectory
-            _walk_directory(entry, lines, prefix + extension, depth - 1,
-                          show_hidden, fast, context)
+            yield from _walk_directory(entry, prefix + extension, depth - 1,
+                                       show_hidden, fast, context)
 
 
-def _get_file_info(path: Path, fast: bool = False) -> str:
+def _get_file_info(entry: os.DirEntry, fast: bool = False) -> str:
     """Get formatted file info for tree display.
 
     Args:
-        path: File path
+        entry: scandir entry for the file (its cached stat is reused)
         fast: If True, skip expensive line counting
 
     Returns:
@@ -146,35 +234,46 @@ def _get_file_info(path: Path, fast: bool = False) -> str:
     try:
         if fast:
             # Fast mode: just show file size, no analyzer
-            stat = os.stat(path)
-            size = _format_size(stat.st_size)
-            return f"{path.name} ({size})"
+            size = _format_size(entry.stat().st_size)
+            return f"{entry.name} ({size})"
 
         # Normal mode: Try to get analyzer for this file
-        analyzer_class = get_analyzer(str(path))
-
-        if analyzer_class:
-            # Use analyzer to get info
-            analyzer = analyzer_class(str(path))
-            meta = analyzer.get_metadata()
-            file_type = analyzer.type_name
+        size = entry.stat().st_size
+        ext = os.path.splitext(entry.name)[1].lower()
+        if ext not in _BINARY_EXTENSIONS and size <= _MAX_LINE_COUNT_SIZE:
+            analyzer_class = get_analyzer(entry.path)
+            if analyzer_class:
+                # Line count and type name only - no need to build (and parse) an analyzer
+                return f"{entry.name} ({_count_lines(entry.path)} lines, {analyzer_class.type_name})"
 
-            return f"{path.name} ({meta['lines']} lines, {file_type})"
-        else:
-            # No analyzer - just show basic info
-            stat = os.stat(path)
-            size = _format_size(stat.st_size)
-            return f"{path.name} ({size})"
+        # No analyzer - just show basic info
+        return f"{entry.name} ({_format_size(size)})"
 
     except Exception:
         # If anything fails, just show filename
-        return path.name
+        return entry.name
+
+
+def _count_lines(path: str) -> int:
+    """Count lines the way FileAnalyzer does (len of decoded splitlines()).
+
+    Plain ASCII files with '\\n' endings are counted on the raw bytes;
+    anything else is decoded so the count matches the analyzer exactly.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if data.isascii() and not _OTHER_LINE_BREAKS.search(data):
+        return data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+
+    return len(decode_text(data, path).splitlines())
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def _format_size(size: int) -> str:
     """Format file size in human-readable form."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size < 1024.0:
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
-    return f"{size:.1f} TB"
+    # Unit index from the bit length (1024 = 2**10), then a single divide
+    unit = min(max((size.bit_length() - 1) // 10, 0), len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
@@ -1,14 +1,164 @@
 """Tree-sitter based analyzer for multi-language support."""
 
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
 import warnings
-from typing import Dict, List, Any, Optional
-from .base import FileAnalyzer
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Any, Optional, Tuple
+from .base import FileAnalyzer, get_analyzer
+
+logger = logging.getLogger(__name__)
 
 # Suppress tree-sitter deprecation warnings globally
 warnings.filterwarnings('ignore', category=FutureWarning, module='tree_sitter')
 
 from tree_sitter_languages import get_parser
 
+# Parsers are reused across files of the same language; a Parser isn't
+# safe to drive from two threads at once, so parse() calls are serialized.
+_PARSE_LOCK = threading.Lock()
+
+
+# Node types for each structure category, across grammars
+IMPORT_NODE_TYPES = (
+    'import_statement',      # Python, JavaScript
+    'import_declaration',    # Go, Java
+    'use_declaration',       # Rust
+    'using_directive',       # C#
+    'import_from_statement', # Python
+)
+FUNCTION_NODE_TYPES = (
+    'function_definition',   # Python
+    'function_declaration',  # Go, C, JavaScript
+    'function_item',         # Rust
+    'method_declaration',    # Java, C#
+    'function',              # Generic
+)
+CLASS_NODE_TYPES = (
+    'class_definition',      # Python
+    'class_declaration',     # Java, C#, JavaScript
+)
+STRUCT_NODE_TYPES = (
+    'struct_item',           # Rust
+    'struct_specifier',      # C/C++
+    'struct_declaration',    # Go
+)
+
+# Node types accepted as the 'name' field of a function/class/struct
+NAME_NODE_TYPES = frozenset({
+    'identifier', 'name',
+    'type_identifier',       # Rust/C structs, TypeScript classes
+    'field_identifier',      # Go methods
+    'property_identifier',   # JavaScript/TypeScript methods
+})
+# Child types scanned for a name when the grammar has no 'name' field
+# (type identifiers are left out: without the field they are often a
+# return or parameter type, not the name)
+NAME_CHILD_TYPES = frozenset({'identifier', 'name'})
+
+# Definition keywords stripped from the first line when a signature has to
+# be recovered from source text (see _get_signature)
+SIGNATURE_PREFIX_RE = re.compile(r'^(?:async\s+def|async\s+fn|pub\s+fn|function|func|def|fn)\s+')
+
+# Control flow node types that add a nesting level (see _get_nesting_depth)
+NESTING_NODE_TYPES = frozenset({
+    # Conditionals
+    'if_statement', 'if_expression', 'if',
+    # Loops
+    'for_statement', 'for_expression', 'for', 'while_statement', 'while',
+    # Exception handling
+    'try_statement', 'try', 'with_statement', 'with',
+    # Pattern matching
+    'match_statement', 'match_expression', 'case_statement',
+    # Other control flow
+    'do_statement', 'switch_statement',
+})
+
+# Node types extract_element() looks up for each element type
+ELEMENT_NODE_TYPES = {
+    'function': ('function_definition', 'function_declaration', 'function_item', 'method_declaration'),
+    'class': ('class_definition', 'class_declaration'),
+    'struct': ('struct_item', 'struct_specifier', 'struct_declaration'),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_parser(language: str):
+    """Get the tree-sitter parser for a language, creating it once."""
+    return get_parser(language)
+
+
+# Optional on-disk cache of extracted structure, enabled by pointing
+# REVEAL_CACHE_DIR at a directory. Entries are keyed by a hash of the file
+# content (plus reveal version and analyzer), so edits never hit stale data.
+STRUCTURE_CACHE_ENV = 'REVEAL_CACHE_DIR'
+_STRUCTURE_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _open_structure_cache(cache_dir: str, pid: int) -> sqlite3.Connection:
+    """Open (creating if needed) the structure cache database in cache_dir.
+
+    Keyed by process id as well: a forked analyze_files() worker inherits
+    this cache, and SQLite connections must not be used across fork(), so
+    each worker opens its own instead of touching the parent's.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(cache_dir, 'structure.sqlite3'),
+                           check_same_thread=False)
+    conn.execute('CREATE TABLE IF NOT EXISTS structure '
+                 '(key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+    return conn
+
+
+def _point(data: bytes, offset: int) -> Tuple[int, int]:
+    """(row, byte column) of a byte offset, as tree-sitter points are expressed."""
+    return data.count(b'\n', 0, offset), offset - (data.rfind(b'\n', 0, offset) + 1)
+
+
+def _matching_length(a: bytes, b: bytes, limit: int, from_end: bool = False) -> int:
+    """Length of the common prefix (or suffix) of a and b, at most limit.
+
+    Binary search over slice comparisons, so the scan runs at memcmp speed.
+    """
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if from_end:
+            same = a[len(a) - mid:] == b[len(b) - mid:]
+        else:
+            same = a[:mid] == b[:mid]
+        if same:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _compute_edit(old: bytes, new: bytes) -> Dict[str, Any]:
+    """Describe old -> new as a single tree-sitter edit (keyword args for Tree.edit).
+
+    The edited range is what remains after trimming the common prefix and
+    suffix, so unchanged regions at both ends keep their subtrees.
+    """
+    start = _matching_length(old, new, min(len(old), len(new)))
+    suffix = _matching_length(old, new, min(len(old), len(new)) - start, from_end=True)
+    old_end, new_end = len(old) - suffix, len(new) - suffix
+    return {
+        'start_byte': start,
+        'old_end_byte': old_end,
+        'new_end_byte': new_end,
+        'start_point': _point(old, start),
+        'old_end_point': _point(old, old_end),
+        'new_end_point': _point(new, new_end),
+    }
+
 
 class TreeSitterAnalyzer(FileAnalyzer):
     """Base class for tree-sitter based analyzers.
@@ -18,6 +168,9 @@ class TreeSitterAnalyzer(FileAnalyzer):
     Subclass just needs to set:
         language (str): tree-sitter language name (e.g., 'python', 'rust', 'go')
 
+    Optionally, node_types maps each structure category to the node types
+    to extract for it, so a language can narrow or extend the defaults.
+
     Everything else is automatic:
     - Structure extraction (imports, functions, classes, structs)
     - Element extraction (get specific function/class)
@@ -32,20 +185,82 @@ class TreeSitterAnalyzer(FileAnalyzer):
 
     language: str = None  # Set in subclass
 
-    def __init__(self, path: str):
-        super().__init__(path)
-        self.tree = None
+    node_types: Dict[str, Tuple[str, ...]] = {
+        'imports': IMPORT_NODE_TYPES,
+        'functions': FUNCTION_NODE_TYPES,
+        'classes': CLASS_NODE_TYPES,
+        'structs': STRUCT_NODE_TYPES,
+    }
+
+    # Types indexed by the single tree walk (other lookups scan); derived
+    # from node_types once per class
+    _indexed_node_types: FrozenSet[str] = frozenset().union(*node_types.values())
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._indexed_node_types = frozenset().union(*cls.node_types.values())
+
+    def __init__(self, path: str, source=None):
+        super().__init__(path, source)
+        self._tree = None
+        self._tree_parsed = False  # Parsed on first access to self.tree
+        self._content_bytes = None  # Encoded on demand by content_bytes
+        self._content_view = None  # memoryview over content_bytes, see _get_node_text()
+        self._nodes_by_type = None  # Built on demand by _find_nodes_by_type()
+        self._element_index: Dict[str, Dict[str, Any]] = {}  # See _find_element()
+
+    @classmethod
+    def from_previous(cls, previous: 'TreeSitterAnalyzer', source) -> 'TreeSitterAnalyzer':
+        """Analyze an edited version of a file, re-parsing incrementally.
+
+        For watch-mode and editor integrations: previous's tree is edited to
+        match the new content and handed to the parser, so only the changed
+        region is re-parsed. previous's tree is modified in place, so
+        previous should not be used afterwards.
+
+        Args:
+            previous: Analyzer for the same file before the edit
+            source: New content (str, bytes or file-like object)
+        """
+        analyzer = cls(previous.path, source=source)
+        old_tree = previous.tree
+        if old_tree is None or not analyzer.language:
+            return analyzer  # Nothing to reuse; parse from scratch on demand
+
+        new_bytes = analyzer.content_bytes
+        old_tree.edit(**_compute_edit(previous.content_bytes, new_bytes))
+        try:
+            with _PARSE_LOCK:
+                analyzer.tree = _get_parser(analyzer.language).parse(new_bytes, old_tree)
+        except Exception:
+            pass  # Leave the tree unparsed; first use parses from scratch
+        return analyzer
+
+    @property
+    def tree(self):
+        """Tree-sitter parse tree (None if parsing failed), parsed on first use.
+
+        Analyzers that are only asked for metadata, or whose structure comes
+        from the on-disk cache, never pay for a parse.
+        """
+        if not self._tree_parsed:
+            self._tree_parsed = True
+            if self.language:
+                self._parse_tree()
+        return self._tree
 
-        if self.language:
-            self._parse_tree()
+    @tree.setter
+    def tree(self, value):
+        self._tree = value
+        self._tree_parsed = True
 
     def _parse_tree(self):
         """Parse file with tree-sitter."""
         try:
-            with warnings.catch_warnings():
-                warnings.filterwarnings('ignore', category=FutureWarning, module='tree_sitter')
-                parser = get_parser(self.language)
-                self.tree = parser.parse(self.content.encode('utf-8'))
+            # tree-sitter FutureWarnings are filtered once at module import
+            parser = _get_parser(self.language)
+            with _PARSE_LOCK:
+                self.tree = parser.parse(self.content_bytes)
         except Exception as e:
             # Parsing failed - fall back to text analysis
             self.tree = None
@@ -66,41 +281,80 @@ class TreeSitterAnalyzer(FileAnalyzer):
         Note: Slicing applies to each category independently
         (e.g., --head 5 shows first 5 functions AND first 5 classes)
         """
-        if not self.tree:
-            return {}
-
-        structure = {}
-
-        # Extract common elements
-        structure['imports'] = self._extract_imports()
-        structure['functions'] = self._extract_functions()
-        structure['classes'] = self._extract_classes()
-        structure['structs'] = self._extract_structs()
+        # Extract once; head/tail/range views of the same file slice the cached result
+        extracted = self._cached_parse('structure', self._load_structure)
 
         # Apply semantic slicing to each category
-        if head or tail or range:
-            for category in structure:
-                structure[category] = self._apply_semantic_slice(
-                    structure[category], head, tail, range
-                )
+        structure = {}
+        for category, items in extracted.items():
+            if head or tail or range:
+                items = self._apply_semantic_slice(items, head, tail, range)
+            else:
+                items = list(items)  # Cached list is shared
+            structure[category] = items
 
         # Remove empty categories
         return {k: v for k, v in structure.items() if v}
 
+    def _load_structure(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract structure, going through the on-disk cache if enabled."""
+        cache_dir = os.environ.get(STRUCTURE_CACHE_ENV)
+        if not cache_dir:
+            return self._extract_structure()
+
+        key = self._structure_cache_key()
+        try:
+            with _STRUCTURE_CACHE_LOCK:
+                row = _open_structure_cache(cache_dir, os.getpid()).execute(
+                    'SELECT value FROM structure WHERE key = ?', (key,)).fetchone()
+            if row:
+                return json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.debug(f"Structure cache unavailable ({e}), extracting {self.path}")
+            return self._extract_structure()
+
+        structure = self._extract_structure()
+        if not self.tree:
+            return structure  # Don't cache a failed parse (parser may be missing)
+
+        try:
+            with _STRUCTURE_CACHE_LOCK:
+                conn = _open_structure_cache(cache_dir, os.getpid())
+                conn.execute('INSERT OR REPLACE INTO structure VALUES (?, ?)',
+                             (key, json.dumps(structure)))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Could not cache structure for {self.path}: {e}")
+        return structure
+
+    def _structure_cache_key(self) -> str:
+        """Hash identifying this file's structure: content, analyzer and version."""
+        from . import __version__
+
+        cls = type(self)
+        digest = hashlib.sha256(
+            f"{__version__}\0{cls.__module__}.{cls.__qualname__}\0{self.language}\0".encode()
+        )
+        digest.update(self.content_bytes)
+        return digest.hexdigest()
+
+    def _extract_structure(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract all structure categories from the parsed tree."""
+        if not self.tree:
+            return {}
+
+        return {
+            'imports': self._extract_imports(),
+            'functions': self._extract_functions(),
+            'classes': self._extract_classes(),
+            'structs': self._extract_structs(),
+        }
+
     def _extract_imports(self) -> List[Dict[str, Any]]:
         """Extract import statements."""
         imports = []
 
-        # Common import node types across languages
-        import_types = [
-            'import_statement',      # Python, JavaScript
-            'import_declaration',    # Go, Java
-            'use_declaration',       # Rust
-            'using_directive',       # C#
-            'import_from_statement', # Python
-        ]
-
-        for import_type in import_types:
+        for import_type in self.node_types['imports']:
             nodes = self._find_nodes_by_type(import_type)
             for node in nodes:
                 imports.append({
@@ -114,16 +368,7 @@ class TreeSitterAnalyzer(FileAnalyzer):
         """Extract function definitions with complexity metrics."""
         functions = []
 
-        # Common function node types
-        function_types = [
-            'function_definition',   # Python
-            'function_declaration',  # Go, C, JavaScript
-            'function_item',         # Rust
-            'method_declaration',    # Java, C#
-            'function',              # Generic
-        ]
-
-        for func_type in function_types:
+        for func_type in self.node_types['functions']:
             nodes = self._find_nodes_by_type(func_type)
             for node in nodes:
                 name = self._get_function_name(node)
@@ -147,13 +392,7 @@ class TreeSitterAnalyzer(FileAnalyzer):
         """Extract class definitions."""
         classes = []
 
-        class_types = [
-            'class_definition',      # Python
-            'class_declaration',     # Java, C#, JavaScript
-            'struct_item',           # Rust (treated as class)
-        ]
-
-        for class_type in class_types:
+        for class_type in self.node_types['classes']:
             nodes = self._find_nodes_by_type(class_type)
             for node in nodes:
                 name = self._get_class_name(node)
@@ -172,13 +411,7 @@ class TreeSitterAnalyzer(FileAnalyzer):
         """Extract struct definitions (for languages that have them)."""
         structs = []
 
-        struct_types = [
-            'struct_item',           # Rust
-            'struct_specifier',      # C/C++
-            'struct_declaration',    # Go
-        ]
-
-        for struct_type in struct_types:
+        for struct_type in self.node_types['structs']:
             nodes = self._find_nodes_by_type(struct_type)
             for node in nodes:
                 name = self._get_struct_name(node)
@@ -206,64 +439,108 @@ class TreeSitterAnalyzer(FileAnalyzer):
         if not self.tree:
             return super().extract_element(element_type, name)
 
-        # Map element type to node types
-        type_map = {
-            'function': ['function_definition', 'function_declaration', 'function_item', 'method_declaration'],
-            'class': ['class_definition', 'class_declaration'],
-            'struct': ['struct_item', 'struct_specifier', 'struct_declaration'],
-        }
-
-        node_types = type_map.get(element_type, [element_type])
-
-        # Find matching node
-        for node_type in node_types:
-            nodes = self._find_nodes_by_type(node_type)
-            for node in nodes:
-                node_name = self._get_node_name(node)
-                if node_name == name:
-                    return {
-                        'name': name,
-                        'line_start': node.start_point[0] + 1,
-                        'line_end': node.end_point[0] + 1,
-                        'source': self._get_node_text(node),
-                    }
+        node = self._find_element(element_type, name)
+        if node is not None:
+            return {
+                'name': name,
+                'line_start': node.start_point[0] + 1,
+                'line_end': node.end_point[0] + 1,
+                'source': self._get_node_text(node),
+            }
 
         # Fall back to grep
         return super().extract_element(element_type, name)
 
+    def _find_element(self, element_type: str, name: str):
+        """Find the first node of an element type with the given name.
+
+        Nodes are indexed by name once per element type, so repeated
+        lookups on the same file are dict reads. The first node wins, in
+        node-type order and then document order.
+        """
+        index = self._element_index.get(element_type)
+        if index is None:
+            index = {}
+            # Map element type to node types
+            for node_type in ELEMENT_NODE_TYPES.get(element_type, (element_type,)):
+                for node in self._find_nodes_by_type(node_type):
+                    index.setdefault(self._get_node_name(node), node)
+            self._element_index[element_type] = index
+
+        return index.get(name)
+
     def _find_nodes_by_type(self, node_type: str) -> List:
-        """Find all nodes of a given type in the tree."""
+        """Find all nodes of a given type in the tree (in document order).
+
+        The tree is walked once and structure node types are bucketed with
+        a set lookup, so the dozen or so lookups made while extracting
+        structure share one walk. Other node types are found by a scan.
+        """
         if not self.tree:
             return []
 
-        nodes = []
+        indexed = self._indexed_node_types
+        if node_type not in indexed:
+            return [node for node in self._iter_nodes() if node.type == node_type]
+
+        if self._nodes_by_type is None:
+            nodes_by_type: Dict[str, List] = {}
+            for node in self._iter_nodes():
+                if node.type in indexed:
+                    nodes_by_type.setdefault(node.type, []).append(node)
+            self._nodes_by_type = nodes_by_type
 
-        def walk(node):
-            if node.type == node_type:
-                nodes.append(node)
-            for child in node.children:
-                walk(child)
+        return self._nodes_by_type.get(node_type, [])
 
-        walk(self.tree.root_node)
-        return nodes
+    def _iter_nodes(self) -> Iterator:
+        """Yield every node in the tree, depth-first in document order.
+
+        Uses a TreeCursor, which moves through the tree in C instead of
+        materializing each node's children list.
+        """
+        cursor = self.tree.walk()
+        while True:
+            yield cursor.node
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
+
+    @property
+    def content_bytes(self) -> bytes:
+        """UTF-8 encoded content, encoded once and shared by parse and node lookups."""
+        if self._content_bytes is None:
+            self._content_bytes = self.content.encode('utf-8')
+        return self._content_bytes
 
     def _get_node_text(self, node) -> str:
         """Get the source text for a node.
 
         IMPORTANT: Tree-sitter uses byte offsets, not character offsets!
         Must slice the UTF-8 bytes, not the string, to handle multi-byte characters.
+        Slicing a memoryview decodes straight from the shared buffer, without
+        copying the node's bytes first.
         """
-        start_byte = node.start_byte
-        end_byte = node.end_byte
-        # Convert to bytes, slice, then decode back to string
-        content_bytes = self.content.encode('utf-8')
-        return content_bytes[start_byte:end_byte].decode('utf-8')
+        if self._content_view is None:
+            self._content_view = memoryview(self.content_bytes)
+        return str(self._content_view[node.start_byte:node.end_byte], 'utf-8')
 
     def _get_node_name(self, node) -> Optional[str]:
         """Get the name of a node (function/class/struct name)."""
+        # Most grammars expose the name as a field; check it before
+        # materializing the children list
+        child = node.child_by_field_name('name')
+        if child is not None and child.type in NAME_NODE_TYPES:
+            # A C/C++ struct_specifier without a body is a reference to the
+            # struct (struct foo *p;), not its definition
+            if node.type == 'struct_specifier' and node.child_by_field_name('body') is None:
+                return None
+            return self._get_node_text(child)
+
         # Look for 'name' or 'identifier' child
         for child in node.children:
-            if child.type in ('identifier', 'name'):
+            if child.type in NAME_CHILD_TYPES:
                 return self._get_node_text(child)
 
         return None
@@ -300,10 +577,7 @@ class TreeSitterAnalyzer(FileAnalyzer):
         first_line = text.split('\n')[0].strip()
 
         # Remove common prefixes (def, func, fn, function, etc.)
-        for prefix in ['def ', 'func ', 'fn ', 'function ', 'async def ', 'pub fn ', 'fn ', 'async fn ']:
-            if first_line.startswith(prefix):
-                first_line = first_line[len(prefix):]
-                break
+        first_line = SIGNATURE_PREFIX_RE.sub('', first_line, count=1)
 
         # Extract just the signature part (name + params + return)
         # Remove the name to leave just params + return type
@@ -329,34 +603,75 @@ class TreeSitterAnalyzer(FileAnalyzer):
         if not node:
             return 0
 
-        # Control flow node types across languages
-        nesting_types = {
-            # Conditionals
-            'if_statement', 'if_expression', 'if',
-            # Loops
-            'for_statement', 'for_expression', 'for', 'while_statement', 'while',
-            # Exception handling
-            'try_statement', 'try', 'with_statement', 'with',
-            # Pattern matching
-            'match_statement', 'match_expression', 'case_statement',
-            # Other control flow
-            'do_statement', 'switch_statement',
-        }
+        # Walk the function's subtree with a cursor, tracking the nesting
+        # depth of each level on a stack (no recursion, no children lists)
+        cursor = node.walk()
+        depths = [0]  # depths[i]: nesting depth at cursor level i (function = 0)
+        max_depth = 0
+
+        while True:
+            if cursor.goto_first_child():
+                depths.append(depths[-1] + (cursor.node.type in NESTING_NODE_TYPES))
+            else:
+                while True:
+                    if len(depths) == 1:
+                        return max_depth  # Back at the function node
+                    if cursor.goto_next_sibling():
+                        depths[-1] = depths[-2] + (cursor.node.type in NESTING_NODE_TYPES)
+                        break
+                    cursor.goto_parent()
+                    depths.pop()
+
+            if depths[-1] > max_depth:
+                max_depth = depths[-1]
+
+
+def _warm_parsers(languages: Iterable[str]) -> None:
+    """Worker initializer: load the parsers a batch needs before it starts."""
+    for language in languages:
+        try:
+            _get_parser(language)
+        except Exception:
+            pass  # Reported when the file is analyzed
 
-        def get_depth(n, current_depth=0):
-            """Recursively calculate depth."""
-            max_depth = current_depth
 
-            for child in n.children:
-                child_depth = current_depth
-                # If this child is a nesting construct, increase depth
-                if child.type in nesting_types:
-                    child_depth = current_depth + 1
+def _analyze_file(path: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Worker task: structure of one file, or None if it can't be analyzed."""
+    analyzer_class = get_analyzer(path)
+    if not analyzer_class:
+        return None
+    try:
+        return analyzer_class(path).get_structure()
+    except Exception as e:
+        logger.debug(f"Could not analyze {path}: {e}")
+        return None
 
-                # Recursively check children
-                nested_depth = get_depth(child, child_depth)
-                max_depth = max(max_depth, nested_depth)
 
-            return max_depth
+def analyze_files(paths: Iterable[str],
+                  max_workers: Optional[int] = None) -> List[Optional[Dict[str, List[Dict[str, Any]]]]]:
+    """Extract structure for many files in parallel.
 
-        return get_depth(node)
+    Parsing holds the GIL (and a shared parser is locked), so files are
+    farmed out to worker processes, each loading the needed parsers once.
+
+    Args:
+        paths: File paths to analyze
+        max_workers: Number of worker processes (default: one per CPU)
+
+    Returns:
+        Structure per path, in the same order; None for files with no
+        analyzer or that failed to analyze
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+
+    languages = set()
+    for path in paths:
+        language = getattr(get_analyzer(path), 'language', None)
+        if language:
+            languages.add(language)
+
+    with ProcessPoolExecutor(max_workers, initializer=_warm_parsers,
+                             initargs=(sorted(languages),)) as executor:
+        return list(executor.map(_analyze_file, paths))
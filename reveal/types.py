@@ -27,13 +27,63 @@ Usage:
     }
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any, Union, get_origin, get_args
+from functools import lru_cache
+from typing import Optional, Dict, FrozenSet, List, Any, Set, Tuple, Union, get_origin, get_args
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _compile_type(typ: Any) -> Tuple[str, Any]:
+    """Work out once how values are checked against a property type.
+
+    Returns (kind, arg):
+    - ('isinstance', cls): value must be an instance of cls
+    - ('union', (checks, optional)): value must match one of the member
+      checks (None excluded); optional is True if None is a member
+    - ('any', None): generic types other than list/dict aren't checked
+    """
+    origin = get_origin(typ)
+    if origin is Union:
+        args = get_args(typ)
+        checks = tuple(_compile_type(arg) for arg in args if arg is not type(None))
+        return ('union', (checks, type(None) in args))
+    if origin is list or origin is dict:
+        return ('isinstance', origin)
+    if origin is not None:
+        return ('any', None)
+    return ('isinstance', typ)
+
+
+def _is_valid_check(check: Tuple[str, Any]) -> bool:
+    """Whether a compiled type only checks against real types (see _compile_type)."""
+    kind, arg = check
+    if kind == 'isinstance':
+        return isinstance(arg, type)
+    if kind == 'union':
+        return all(_is_valid_check(member) for member in arg[0])
+    return True
+
+
+def _merge_names(inherited: List[str], own: List[str]) -> List[str]:
+    """inherited followed by the names in own that it doesn't already have."""
+    seen = set(inherited)
+    return list(inherited) + [name for name in own if name not in seen]
+
+
+def _matches(value: Any, check: Tuple[str, Any]) -> bool:
+    """Check a value against a compiled type (see _compile_type)."""
+    kind, arg = check
+    if kind == 'isinstance':
+        return isinstance(value, arg)
+    if kind == 'union':
+        return any(_matches(value, member) for member in arg[0])
+    return True
+
+
 @dataclass
 class Entity:
     """Declare an entity type for semantic code elements.
@@ -97,24 +147,11 @@ class Entity:
         - Generic types (list[str], dict[str, int])
         - Optional types (Optional[str])
         """
-        # Handle None
-        if typ is type(None):
-            return True
-
-        # Handle Union types (including | syntax and Optional)
-        origin = get_origin(typ)
-        if origin is Union:
-            return all(Entity._is_valid_type(arg) for arg in get_args(typ))
-
-        # Handle generic types (list[str], dict[str, int])
-        if origin is not None:
-            return True
-
-        # Handle built-in types
-        if isinstance(typ, type):
-            return True
-
-        return False
+        try:
+            check = _compile_type(typ)  # Also warms the cache used by validate_entity()
+        except TypeError:
+            return False  # Unhashable, so not a type annotation
+        return _is_valid_check(check)
 
 
 @dataclass
@@ -239,6 +276,14 @@ class TypeRegistry:
     def __init__(self):
         self.types: Dict[str, Entity] = {}
         self._inheritance_resolved = False
+        # Compiled property checks per type, built by validate_entity()
+        self._property_checks: Dict[str, List[Tuple[str, Any, Tuple[str, Any]]]] = {}
+        # Each type plus everything it inherits from, built by get_ancestors()
+        self._ancestors: Dict[str, FrozenSet[str]] = {}
+        # Direct subtypes of each type (reverse of inherits) and memoized
+        # get_subtypes() results
+        self._children: Optional[Dict[str, List[str]]] = None
+        self._subtypes: Dict[str, Tuple[str, ...]] = {}
 
     def register_types(self, types: Dict[str, Entity]) -> None:
         """Register entity types.
@@ -246,8 +291,15 @@ class TypeRegistry:
         Args:
             types: Dict mapping type names to Entity definitions
         """
+        if all(self.types.get(name) is entity for name, entity in types.items()):
+            return  # Already registered; keep resolved state and caches
+
         self.types.update(types)
         self._inheritance_resolved = False
+        self._property_checks.clear()
+        self._ancestors.clear()
+        self._children = None
+        self._subtypes.clear()
 
     def resolve_inheritance(self) -> None:
         """Resolve type inheritance by merging parent properties.
@@ -258,62 +310,57 @@ class TypeRegistry:
         if self._inheritance_resolved:
             return
 
-        # Build dependency graph to handle multi-level inheritance
-        resolved = set()
-        in_progress = set()
-
-        def resolve_type(type_name: str) -> None:
-            """Recursively resolve a type's inheritance."""
-            if type_name in resolved:
-                return
-
-            if type_name in in_progress:
-                raise ValueError(f"Circular inheritance detected: {type_name}")
-
-            entity = self.types.get(type_name)
-            if not entity or not entity.inherits:
-                resolved.add(type_name)
-                return
-
-            # Resolve parent first
-            in_progress.add(type_name)
+        # Index each type under its parent; types without a (known) parent
+        # are resolved as they are
+        children: Dict[str, List[str]] = {}
+        queue = deque()
+        for type_name, entity in self.types.items():
             parent_name = entity.inherits
-
-            if parent_name not in self.types:
+            if not parent_name:
+                queue.append(type_name)
+            elif parent_name not in self.types:
                 logger.warning(
                     f"Type '{type_name}' inherits from unknown type '{parent_name}'"
                 )
-                resolved.add(type_name)
-                in_progress.remove(type_name)
-                return
+                queue.append(type_name)
+            else:
+                children.setdefault(parent_name, []).append(type_name)
 
-            resolve_type(parent_name)
+        # Resolve parents before children (topological order), so multi-level
+        # chains merge in one pass
+        resolved = set()
+        while queue:
+            parent_name = queue.popleft()
+            resolved.add(parent_name)
             parent = self.types[parent_name]
 
-            # Merge parent properties (child properties override parent)
-            merged_properties = {**parent.properties, **entity.properties}
-            entity.properties = merged_properties
+            for type_name in children.get(parent_name, ()):
+                entity = self.types[type_name]
 
-            # Merge contains lists (child adds to parent)
-            merged_contains = list(parent.contains) + [
-                c for c in entity.contains if c not in parent.contains
-            ]
-            entity.contains = merged_contains
+                # Merge parent properties (child properties override parent)
+                if parent.properties:
+                    entity.properties = {**parent.properties, **entity.properties}
 
-            # Merge searchable lists (child adds to parent)
-            merged_searchable = list(parent.searchable) + [
-                s for s in entity.searchable if s not in parent.searchable
-            ]
-            entity.searchable = merged_searchable
+                # Merge contains and searchable lists (child adds to parent)
+                if parent.contains:
+                    entity.contains = _merge_names(parent.contains, entity.contains)
+                if parent.searchable:
+                    entity.searchable = _merge_names(parent.searchable, entity.searchable)
 
-            resolved.add(type_name)
-            in_progress.remove(type_name)
+                queue.append(type_name)
 
-        # Resolve all types
-        for type_name in list(self.types.keys()):
-            resolve_type(type_name)
+        # Anything left is on (or inherits from) a cycle; report the first
+        # type found on the cycle
+        if len(resolved) < len(self.types):
+            type_name = next(name for name in self.types if name not in resolved)
+            seen = set()
+            while type_name not in seen:
+                seen.add(type_name)
+                type_name = self.types[type_name].inherits
+            raise ValueError(f"Circular inheritance detected: {type_name}")
 
         self._inheritance_resolved = True
+        self._property_checks.clear()  # Properties now include inherited ones
 
     def get_type(self, type_name: str) -> Optional[Entity]:
         """Get entity type by name.
@@ -335,13 +382,27 @@ class TypeRegistry:
         Returns:
             List of subtype names
         """
-        subtypes = []
-        for name, entity in self.types.items():
-            if entity.inherits == type_name:
-                subtypes.append(name)
-                # Recursively get subtypes of subtypes
-                subtypes.extend(self.get_subtypes(name))
-        return subtypes
+        subtypes = self._subtypes.get(type_name)
+        if subtypes is None:
+            if self._children is None:
+                self._children = {}
+                for name, entity in self.types.items():
+                    if entity.inherits:
+                        self._children.setdefault(entity.inherits, []).append(name)
+
+            # Depth-first, each subtype followed by its own subtypes
+            result = []
+            seen = {type_name}
+            stack = list(reversed(self._children.get(type_name, [])))
+            while stack:
+                name = stack.pop()
+                if name in seen:
+                    continue  # Circular inheritance
+                seen.add(name)
+                result.append(name)
+                stack.extend(reversed(self._children.get(name, [])))
+            subtypes = self._subtypes[type_name] = tuple(result)
+        return list(subtypes)
 
     def is_subtype_of(self, child: str, parent: str) -> bool:
         """Check if child type inherits from parent type.
@@ -353,18 +414,29 @@ class TypeRegistry:
         Returns:
             True if child inherits from parent (directly or transitively)
         """
-        if child == parent:
-            return True
+        return parent in self.get_ancestors(child)
 
-        entity = self.types.get(child)
-        if not entity or not entity.inherits:
-            return False
+    def get_ancestors(self, type_name: str) -> FrozenSet[str]:
+        """Get a type and all the types it inherits from.
 
-        if entity.inherits == parent:
-            return True
+        The inheritance chain is walked once per type; later calls (e.g.
+        is_subtype_of() for every relationship edge) are set lookups.
 
-        # Check parent's parent
-        return self.is_subtype_of(entity.inherits, parent)
+        Args:
+            type_name: Type name
+
+        Returns:
+            Frozenset of type_name and its ancestors (direct and transitive)
+        """
+        ancestors = self._ancestors.get(type_name)
+        if ancestors is None:
+            chain = [type_name]
+            entity = self.types.get(type_name)
+            while entity and entity.inherits and entity.inherits not in chain:
+                chain.append(entity.inherits)
+                entity = self.types.get(entity.inherits)
+            ancestors = self._ancestors[type_name] = frozenset(chain)
+        return ancestors
 
     def validate_entity(self, type_name: str, entity_data: Dict[str, Any]) -> List[str]:
         """Validate an entity instance against its type definition.
@@ -383,12 +455,18 @@ class TypeRegistry:
             errors.append(f"Unknown entity type: {type_name}")
             return errors
 
+        # Property types are introspected once per type, not per entity
+        checks = self._property_checks.get(type_name)
+        if checks is None:
+            checks = [(prop_name, prop_type, _compile_type(prop_type))
+                      for prop_name, prop_type in entity_def.properties.items()]
+            self._property_checks[type_name] = checks
+
         # Check required properties
-        for prop_name, prop_type in entity_def.properties.items():
+        for prop_name, expected_type, check in checks:
             if prop_name not in entity_data:
                 # Property is missing - this might be OK if it's optional (None union)
-                origin = get_origin(prop_type)
-                if origin is Union and type(None) in get_args(prop_type):
+                if check[0] == 'union' and check[1][1]:
                     continue  # Optional property
                 # For now, we'll be lenient and just warn
                 logger.debug(f"Entity '{type_name}' missing property '{prop_name}'")
@@ -396,42 +474,17 @@ class TypeRegistry:
 
             # Type check (basic validation)
             value = entity_data[prop_name]
-            if value is not None:
-                expected_type = prop_type
-                origin = get_origin(expected_type)
-
-                # Handle Union types (str | None)
-                if origin is Union:
-                    args = get_args(expected_type)
-                    valid = any(self._check_type(value, arg) for arg in args if arg is not type(None))
-                    if not valid and value is not None:
-                        errors.append(
-                            f"Property '{prop_name}' has invalid type: expected {expected_type}, got {type(value)}"
-                        )
-                # Handle other types
-                elif not self._check_type(value, expected_type):
-                    errors.append(
-                        f"Property '{prop_name}' has invalid type: expected {expected_type}, got {type(value)}"
-                    )
+            if value is not None and not _matches(value, check):
+                errors.append(
+                    f"Property '{prop_name}' has invalid type: expected {expected_type}, got {type(value)}"
+                )
 
         return errors
 
     @staticmethod
     def _check_type(value: Any, expected_type: type) -> bool:
         """Check if value matches expected type."""
-        origin = get_origin(expected_type)
-
-        # Handle generic types (list, dict, etc.)
-        if origin is not None:
-            if origin is list:
-                return isinstance(value, list)
-            elif origin is dict:
-                return isinstance(value, dict)
-            # Add more generic type checks as needed
-            return True
-
-        # Handle basic types
-        return isinstance(value, expected_type)
+        return _matches(value, _compile_type(expected_type))
 
 
 class RelationshipRegistry:
@@ -452,6 +505,10 @@ class RelationshipRegistry:
     def __init__(self, type_registry: TypeRegistry):
         self.type_registry = type_registry
         self.relationships: Dict[str, RelationshipDef] = {}
+        # (from_types, to_types) of each relationship as sets, for validation
+        self._allowed_types: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        # Names of bidirectional relationships (the only ones build_index() extends)
+        self._bidirectional: Set[str] = set()
 
     def register_relationships(self, relationships: Dict[str, RelationshipDef]) -> None:
         """Register relationship definitions.
@@ -465,6 +522,11 @@ class RelationshipRegistry:
                 rel_def.reverse_name = f"{name}_by"
 
             self.relationships[name] = rel_def
+            self._allowed_types[name] = (frozenset(rel_def.from_types), frozenset(rel_def.to_types))
+            if rel_def.bidirectional:
+                self._bidirectional.add(name)
+            else:
+                self._bidirectional.discard(name)
 
     def validate_relationship(
         self, rel_name: str, edge: Dict[str, Any]
@@ -478,51 +540,69 @@ class RelationshipRegistry:
         Returns:
             List of validation error messages (empty if valid)
         """
-        errors = []
+        return [error for _, error in self.validate_edges(rel_name, [edge])]
+
+    def validate_edges(
+        self, rel_name: str, edges: List[Dict[str, Any]]
+    ) -> List[Tuple[int, str]]:
+        """Validate many edges of one relationship.
+
+        The relationship is looked up once, and each distinct endpoint type
+        is checked once, however many edges use it.
 
+        Args:
+            rel_name: Relationship name
+            edges: Edge data dicts with 'from' and 'to' keys
+
+        Returns:
+            (edge index, error message) pairs, in edge order (empty if all valid)
+        """
         rel_def = self.relationships.get(rel_name)
         if not rel_def:
-            errors.append(f"Unknown relationship: {rel_name}")
-            return errors
+            return [(i, f"Unknown relationship: {rel_name}") for i in range(len(edges))]
 
-        # Check edge has required keys
-        if 'from' not in edge:
-            errors.append(f"Relationship edge missing 'from' key")
-        if 'to' not in edge:
-            errors.append(f"Relationship edge missing 'to' key")
-
-        if errors:
-            return errors
+        from_allowed, to_allowed = self._allowed_types[rel_name]
+        get_ancestors = self.type_registry.get_ancestors
+        from_valid: Dict[str, bool] = {}
+        to_valid: Dict[str, bool] = {}
+        errors = []
 
-        # Validate from type
-        from_entity = edge['from']
-        from_type = from_entity.get('type') if isinstance(from_entity, dict) else None
-        if from_type and from_type not in rel_def.from_types:
-            # Check if it's a subtype
-            valid = any(
-                self.type_registry.is_subtype_of(from_type, allowed)
-                for allowed in rel_def.from_types
-            )
-            if not valid:
-                errors.append(
-                    f"Invalid 'from' type '{from_type}' for relationship '{rel_name}'. "
-                    f"Expected one of: {rel_def.from_types}"
-                )
+        for i, edge in enumerate(edges):
+            # Check edge has required keys
+            if 'from' not in edge or 'to' not in edge:
+                if 'from' not in edge:
+                    errors.append((i, f"Relationship edge missing 'from' key"))
+                if 'to' not in edge:
+                    errors.append((i, f"Relationship edge missing 'to' key"))
+                continue
 
-        # Validate to type
-        to_entity = edge['to']
-        to_type = to_entity.get('type') if isinstance(to_entity, dict) else None
-        if to_type and to_type not in rel_def.to_types:
-            # Check if it's a subtype
-            valid = any(
-                self.type_registry.is_subtype_of(to_type, allowed)
-                for allowed in rel_def.to_types
-            )
-            if not valid:
-                errors.append(
-                    f"Invalid 'to' type '{to_type}' for relationship '{rel_name}'. "
-                    f"Expected one of: {rel_def.to_types}"
-                )
+            # Validate from type
+            from_entity = edge['from']
+            from_type = from_entity.get('type') if isinstance(from_entity, dict) else None
+            if from_type:
+                # Valid if the type or any type it inherits from is allowed
+                valid = from_valid.get(from_type)
+                if valid is None:
+                    valid = from_valid[from_type] = not from_allowed.isdisjoint(get_ancestors(from_type))
+                if not valid:
+                    errors.append((i,
+                        f"Invalid 'from' type '{from_type}' for relationship '{rel_name}'. "
+                        f"Expected one of: {rel_def.from_types}"
+                    ))
+
+            # Validate to type
+            to_entity = edge['to']
+            to_type = to_entity.get('type') if isinstance(to_entity, dict) else None
+            if to_type:
+                # Valid if the type or any type it inherits from is allowed
+                valid = to_valid.get(to_type)
+                if valid is None:
+                    valid = to_valid[to_type] = not to_allowed.isdisjoint(get_ancestors(to_type))
+                if not valid:
+                    errors.append((i,
+                        f"Invalid 'to' type '{to_type}' for relationship '{rel_name}'. "
+                        f"Expected one of: {rel_def.to_types}"
+                    ))
 
         return errors
 
@@ -538,34 +618,22 @@ class RelationshipRegistry:
             Enhanced relationship data with bidirectional edges added
         """
         enhanced = dict(relationship_data)
+        if not self._bidirectional:
+            return enhanced  # Nothing to reverse
 
         for rel_name, edges in relationship_data.items():
-            rel_def = self.relationships.get(rel_name)
-            if not rel_def or not rel_def.bidirectional:
+            if rel_name not in self._bidirectional:
                 continue
+            rel_def = self.relationships[rel_name]
 
-            # Generate reverse edges
-            reverse_name = rel_def.reverse_name
-            reverse_edges = []
-
-            for edge in edges:
-                reverse_edge = {
-                    'from': edge['to'],
-                    'to': edge['from'],
-                }
-
-                # Copy over additional properties
-                for key, value in edge.items():
-                    if key not in ('from', 'to'):
-                        reverse_edge[key] = value
-
-                reverse_edges.append(reverse_edge)
+            # Generate reverse edges (swapped endpoints, same properties)
+            reverse_edges = [
+                {**edge, 'from': edge['to'], 'to': edge['from']}
+                for edge in edges
+            ]
 
             # Add or extend reverse relationship
-            if reverse_name in enhanced:
-                enhanced[reverse_name].extend(reverse_edges)
-            else:
-                enhanced[reverse_name] = reverse_edges
+            enhanced.setdefault(rel_def.reverse_name, []).extend(reverse_edges)
 
         return enhanced
 
@@ -587,31 +655,29 @@ class RelationshipRegistry:
         if not rel_def or not rel_def.transitive:
             return []
 
-        edges = relationship_data.get(rel_name, [])
-        visited = set()
+        # Index edges by source entity once, so each hop is a dict lookup
+        # rather than a scan of every edge
+        targets: Dict[Tuple[Any, Any], List[Dict[str, Any]]] = {}
+        for edge in relationship_data.get(rel_name, []):
+            source = edge['from']
+            targets.setdefault((source.get('type'), source.get('name')), []).append(edge['to'])
+
+        # Depth-first from start_entity; a stack of target iterators stands
+        # in for recursion, so long chains can't hit the recursion limit
+        start_id = (start_entity.get('type'), start_entity.get('name'))
+        visited = {start_id}
         reachable = []
+        stack = [iter(targets.get(start_id, ()))]
+
+        while stack:
+            for to_entity in stack[-1]:
+                reachable.append(to_entity)
+                entity_id = (to_entity.get('type'), to_entity.get('name'))
+                if entity_id not in visited:
+                    visited.add(entity_id)
+                    stack.append(iter(targets.get(entity_id, ())))
+                    break
+            else:
+                stack.pop()
 
-        def traverse(entity: Dict[str, Any]) -> None:
-            entity_id = (entity.get('type'), entity.get('name'))
-            if entity_id in visited:
-                return
-
-            visited.add(entity_id)
-
-            # Find edges from this entity
-            for edge in edges:
-                if self._entities_match(edge['from'], entity):
-                    to_entity = edge['to']
-                    reachable.append(to_entity)
-                    traverse(to_entity)
-
-        traverse(start_entity)
         return reachable
-
-    @staticmethod
-    def _entities_match(entity1: Dict[str, Any], entity2: Dict[str, Any]) -> bool:
-        """Check if two entity references match."""
-        return (
-            entity1.get('type') == entity2.get('type') and
-            entity1.get('name') == entity2.get('name')
-        )
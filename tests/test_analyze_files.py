@@ -0,0 +1,69 @@
+"""Tests for batch structure extraction across files."""
+
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+from reveal.analyzers.python import PythonAnalyzer
+from reveal.treesitter import STRUCTURE_CACHE_ENV, analyze_files
+
+
+class TestAnalyzeFiles(unittest.TestCase):
+    """Test that files are analyzed in worker processes, in order."""
+
+    def test_results_follow_input_order(self):
+        """Each path gets its structure; unsupported files get None."""
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name, content in [('a.json', '{"x": 1}'), ('b.unknownext', 'data'),
+                                  ('c.yaml', 'y: 2\n')]:
+                paths.append(os.path.join(tmp, name))
+                with open(paths[-1], 'w') as f:
+                    f.write(content)
+
+            results = analyze_files(paths, max_workers=2)
+
+        self.assertEqual(results, [
+            {'keys': [{'line': 1, 'name': 'x'}]},
+            None,
+            {'keys': [{'line': 1, 'name': 'y'}]},
+        ])
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == 'fork',
+                         'workers must inherit the patched analyzer')
+    def test_workers_open_own_structure_cache(self):
+        """Workers forked after the parent used the cache write through their own connection."""
+        structure = {'functions': [{'line': 1, 'name': 'f'}]}
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = os.path.join(tmp, 'cache')
+            paths = []
+            for name in ('a.py', 'b.py', 'c.py'):
+                paths.append(os.path.join(tmp, name))
+                with open(paths[-1], 'w') as f:
+                    f.write(f'# {name}\ndef f():\n    pass\n')
+
+            with patch.dict(os.environ, {STRUCTURE_CACHE_ENV: cache_dir}), \
+                    patch.object(PythonAnalyzer, '_extract_structure', return_value=structure), \
+                    patch.object(PythonAnalyzer, '_parse_tree',
+                                 lambda analyzer: setattr(analyzer, 'tree', object())):
+                PythonAnalyzer(paths[0])._load_structure()  # Parent opens the cache first
+                results = analyze_files(paths, max_workers=2)
+
+            conn = sqlite3.connect(os.path.join(cache_dir, 'structure.sqlite3'))
+            try:
+                rows = conn.execute('SELECT COUNT(*) FROM structure').fetchone()[0]
+            finally:
+                conn.close()
+
+        self.assertEqual(results, [structure] * 3)
+        self.assertEqual(rows, 3)
+
+    def test_empty(self):
+        """No paths should not start any workers."""
+        self.assertEqual(analyze_files([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Tests for JSONL analyzer."""
+
+import unittest
+import tempfile
+import os
+from io import BytesIO
+from reveal.analyzers.jsonl import JsonlAnalyzer
+
+
+class TestJsonlAnalyzer(unittest.TestCase):
+    """Test JSONL record parsing and summary."""
+
+    def create_temp_jsonl(self, content: str) -> str:
+        """Helper: Create temp JSONL file."""
+        fd, path = tempfile.mkstemp(suffix='.jsonl')
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def test_stdlib_compatible_parsing(self):
+        """Records the stdlib accepts (NaN, big ints) should parse; invalid lines are flagged."""
+        path = self.create_temp_jsonl(
+            '{"type": "a", "v": NaN}\n'
+            '{"type": "a", "v": 123456789012345678901234567890}\n'
+            '{not json}\n'
+        )
+        records = JsonlAnalyzer(path).get_structure()['records']
+
+        self.assertEqual(records[0]['name'], '📊 Summary: 2 records')
+        self.assertEqual(records[1]['name'], 'a #1')
+        self.assertEqual(records[2]['name'], 'a #2')
+        self.assertEqual(records[3]['name'], '⚠️ Invalid JSON')
+        self.assertIn('Expecting property name', records[3]['preview'])
+
+    def test_in_memory_source(self):
+        """Analyzers should accept bytes streams without touching disk."""
+        source = BytesIO(b'{"type": "user"}\n{"type": "assistant"}\n{"type": "user"}\n')
+        analyzer = JsonlAnalyzer('stream.jsonl', source=source)
+        records = analyzer.get_structure(head=1)['records']
+
+        self.assertEqual(records[0]['name'], '📊 Summary: 3 records')
+        self.assertEqual(records[0]['preview'], 'user: 2, assistant: 1')
+        self.assertEqual(records[1]['name'], 'user #1')
+        self.assertEqual(analyzer.get_metadata()['size'], 56)
+
+
+if __name__ == '__main__':
+    unittest.main()
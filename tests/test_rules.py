@@ -0,0 +1,142 @@
+"""Tests for pattern detection rules (reveal/rules/)."""
+
+import unittest
+from pathlib import Path
+
+from reveal.rules.base import BaseRule
+from reveal.rules.bugs.B001 import B001
+from reveal.rules.errors.E501 import E501
+from reveal.rules.refactoring.R913 import R913
+from reveal.rules.security.S701 import S701
+from reveal.rules.urls.U501 import U501
+
+
+class TestB001(unittest.TestCase):
+    """Test bare except detection."""
+
+    def test_detects_bare_except(self):
+        """Bare except should be reported with the except line as context."""
+        content = "try:\n    pass\nexcept:\n    pass\n"
+        detections = B001().check('example.py', None, content)
+
+        self.assertEqual(len(detections), 1)
+        self.assertEqual(detections[0].line, 3)
+        self.assertEqual(detections[0].context, 'except:')
+
+    def test_context_ignores_form_feed(self):
+        """A form feed is not a line break to ast, so it must not shift the context line."""
+        content = "x = 1\x0c\ntry:\n    pass\nexcept:\n    pass\n"
+        detections = B001().check('example.py', None, content)
+
+        self.assertEqual(detections[0].line, 4)
+        self.assertEqual(detections[0].context, 'except:')
+
+    def test_specific_exception_not_reported(self):
+        """Typed except clauses should not be reported."""
+        content = "try:\n    pass\nexcept ValueError:\n    pass\n"
+        self.assertEqual(B001().check('example.py', None, content), [])
+
+    def test_no_except_token(self):
+        """Files without 'except' should produce no detections."""
+        self.assertEqual(B001().check('example.py', None, "x = 1\n"), [])
+
+
+class TestR913(unittest.TestCase):
+    """Test too-many-arguments detection."""
+
+    def test_detects_too_many_args(self):
+        """Functions over the threshold should be reported with the def line as context."""
+        content = "class A:\n    def f(self, a, b, c, d, e, f):\n        pass\n"
+        detections = R913().check('example.py', None, content)
+
+        self.assertEqual(len(detections), 1)
+        self.assertEqual(detections[0].line, 2)
+        self.assertEqual(detections[0].context, 'def f(self, a, b, c, d, e, f):')
+
+    def test_context_ignores_form_feed(self):
+        """A leading form feed line must not shift the context line."""
+        content = "\x0c\ndef f(a, b, c, d, e, f):\n    pass\n"
+        detections = R913().check('example.py', None, content)
+
+        self.assertEqual(detections[0].line, 2)
+        self.assertEqual(detections[0].context, 'def f(a, b, c, d, e, f):')
+
+    def test_suggestion_in_output(self):
+        """The suggestion should be shown by str() and to_dict()."""
+        content = "def f(a, b, c, d, e, f):\n    pass\n"
+        detection = R913().check('example.py', None, content)[0]
+
+        self.assertIn('Reduce to 5 or fewer arguments', detection.to_dict()['suggestion'])
+        self.assertIn('Reduce to 5 or fewer arguments', str(detection))
+
+    def test_under_threshold_not_reported(self):
+        """Functions at or under the threshold should not be reported."""
+        content = "def f(a, b, c, d, e):\n    pass\n"
+        self.assertEqual(R913().check('example.py', None, content), [])
+
+
+class TestSharedAst(unittest.TestCase):
+    """Test that AST-based rules share one parse per file."""
+
+    def test_parse_is_shared(self):
+        """Parsing the same content twice should return the same tree."""
+        content = "def f():\n    pass\n"
+        self.assertIs(BaseRule.parse_python(content, 'example.py'),
+                      BaseRule.parse_python(content, 'example.py'))
+
+
+class TestCreateDetection(unittest.TestCase):
+    """Test the detection factory shared by all rules."""
+
+    def test_accepts_path(self):
+        """A Path file_path should be accepted, as before interning."""
+        detection = B001().create_detection(file_path=Path('a.py'), line=1)
+        self.assertEqual(str(detection.file_path), 'a.py')
+        self.assertEqual(detection.rule_code, 'B001')
+
+
+class TestE501(unittest.TestCase):
+    """Test line length detection."""
+
+    def test_detects_long_line(self):
+        """Only lines over the limit should be reported, with correct line numbers."""
+        content = "short\n" + "x" * 100 + "\nshort\r\n" + "y" * 95 + "\r\n"
+        detections = E501().check('example.py', None, content)
+
+        self.assertEqual([d.line for d in detections], [2, 4])
+        self.assertIn('(95 > 88', detections[1].message)
+
+    def test_ignores_urls(self):
+        """Long lines containing URLs should be skipped."""
+        content = "# https://example.com/" + "a" * 100 + "\n"
+        self.assertEqual(E501().check('example.py', None, content), [])
+
+
+class TestU501(unittest.TestCase):
+    """Test insecure GitHub URL detection."""
+
+    def test_detects_http_urls(self):
+        """Each insecure URL should be reported with line, column and line context."""
+        content = "ok\n  see http://github.com/a/b and http://docs.github.io/x\n"
+        detections = U501().check('README.md', None, content)
+
+        self.assertEqual([(d.line, d.column) for d in detections], [(2, 7), (2, 33)])
+        self.assertEqual(detections[0].context, 'see http://github.com/a/b and http://docs.github.io/x')
+
+
+class TestS701(unittest.TestCase):
+    """Test Docker :latest detection."""
+
+    def test_detects_latest_and_missing_tag(self):
+        """Explicit :latest and untagged images should both be reported."""
+        content = "\nFROM python:latest\nRUN true\nFROM ubuntu\r\nFROM alpine:3.19\n"
+        detections = S701().check('Dockerfile', None, content)
+
+        self.assertEqual([d.line for d in detections], [2, 4])
+        self.assertIn('python:latest', detections[0].message)
+        self.assertIn('ubuntu', detections[1].message)
+        self.assertEqual(detections[1].context, 'FROM ubuntu')
+
+
+if __name__ == '__main__':
+    unittest.main()
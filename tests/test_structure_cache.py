@@ -0,0 +1,50 @@
+"""Tests for the optional on-disk tree-sitter structure cache."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from reveal.analyzers.python import PythonAnalyzer
+from reveal.treesitter import STRUCTURE_CACHE_ENV
+
+
+class TestStructureCache(unittest.TestCase):
+    """Test that extracted structure is reused across analyzer instances."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = os.path.join(tmp.name, 'cache')
+        self.path = os.path.join(tmp.name, 'example.py')
+        with open(self.path, 'w') as f:
+            f.write('def f():\n    pass\n')
+
+    def load(self, parse=lambda analyzer: setattr(analyzer, 'tree', object()), **extract):
+        """Load structure with extraction (and parsing) stubbed out."""
+        with patch.object(PythonAnalyzer, '_extract_structure', **extract), \
+                patch.object(PythonAnalyzer, '_parse_tree', parse):
+            return PythonAnalyzer(self.path)._load_structure()
+
+    def not_called(self, *args):
+        raise AssertionError('parsed or extracted on a cache hit')
+
+    def test_disabled_by_default(self):
+        """Without the environment variable nothing is written."""
+        with patch.dict(os.environ, {STRUCTURE_CACHE_ENV: ''}):
+            self.load(return_value={})
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_cache_hit_skips_extraction(self):
+        """Unchanged content is served from the cache without parsing; edits miss."""
+        structure = {'functions': [{'line': 1, 'name': 'f'}]}
+        with patch.dict(os.environ, {STRUCTURE_CACHE_ENV: self.cache_dir}):
+            self.assertEqual(self.load(return_value=structure), structure)
+            self.assertEqual(self.load(parse=self.not_called, side_effect=self.not_called), structure)
+
+            with open(self.path, 'a') as f:
+                f.write('\ndef g():\n    pass\n')
+            self.assertEqual(self.load(return_value={}), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for directory tree view."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from reveal.tree_view import show_directory_tree
+
+
+class TestDirectoryTree(unittest.TestCase):
+    """Test directory tree rendering."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = Path(self.tmp.name)
+        (root / 'pkg').mkdir()
+        (root / 'pkg' / 'mod.py').write_text('x = 1\ny = 2\n')
+        (root / 'data.bin').write_bytes(b'\0' * 2048)
+        (root / '.hidden').write_text('secret')
+        self.root = root
+
+    def test_tree_layout(self):
+        """Directories sort first, hidden entries are skipped, files show info."""
+        output = show_directory_tree(self.tmp.name)
+        lines = output.splitlines()
+
+        self.assertEqual(lines[2], '├── pkg/')
+        self.assertEqual(lines[3], '│   └── mod.py (2 lines, Python)')
+        self.assertEqual(lines[4], '└── data.bin (2.0 KB)')
+        self.assertNotIn('.hidden', output)
+
+    def test_fast_mode_shows_sizes(self):
+        """Fast mode should report sizes without running analyzers."""
+        output = show_directory_tree(self.tmp.name, fast=True)
+        self.assertIn('mod.py (12.0 B)', output)
+
+    def test_large_and_binary_files_show_sizes(self):
+        """Files over the line-count limit and binary formats show only their size."""
+        (self.root / 'pkg' / 'image.png').write_bytes(b'#!/usr/bin/env python\n')
+        self.assertIn('image.png (22.0 B)', show_directory_tree(self.tmp.name))
+
+        with patch('reveal.tree_view._MAX_LINE_COUNT_SIZE', 4):
+            self.assertIn('mod.py (12.0 B)', show_directory_tree(self.tmp.name))
+
+    def test_max_entries_truncates(self):
+        """Entries past the limit should be counted as truncated."""
+        output = show_directory_tree(self.tmp.name, max_entries=1)
+        self.assertIn('... 2 more entries', output)
+
+    def test_large_directory_warning(self):
+        """The warning should count unshown entries, but only until the threshold."""
+        for d in range(5):
+            sub = self.root / 'pkg' / f'sub{d}'
+            sub.mkdir()
+            for f in range(200):
+                (sub / f'f{f}.txt').touch()
+
+        lines = show_directory_tree(self.tmp.name, max_entries=5, fast=True).splitlines()
+        self.assertEqual(lines[2], '⚠️  Large directory detected (608+ entries)')
+        self.assertEqual(lines[3], '   Showing first 5 entries (use --max-entries 0 for unlimited)')
+        self.assertEqual(lines[4], '├── pkg/')
+
+    def test_not_a_directory(self):
+        """File paths should be rejected."""
+        path = os.path.join(self.tmp.name, 'data.bin')
+        self.assertTrue(show_directory_tree(path).startswith('Error:'))
+
+
+if __name__ == '__main__':
+    unittest.main()
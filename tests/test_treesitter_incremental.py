@@ -0,0 +1,65 @@
+"""Tests for incremental tree-sitter re-parsing support."""
+
+import os
+import unittest
+from unittest.mock import patch
+from reveal.analyzers.python import PythonAnalyzer
+from reveal.treesitter import STRUCTURE_CACHE_ENV, _compute_edit
+
+
+class TestComputeEdit(unittest.TestCase):
+    """Test the single-edit description handed to Tree.edit()."""
+
+    def test_insertion(self):
+        """An inserted line should span only the new bytes."""
+        old = b'def f():\n    pass\n'
+        new = b'def f():\n    x = 1\n    pass\n'
+        self.assertEqual(_compute_edit(old, new), {
+            'start_byte': 13,
+            'old_end_byte': 13,
+            'new_end_byte': 23,
+            'start_point': (1, 4),
+            'old_end_point': (1, 4),
+            'new_end_point': (2, 4),
+        })
+
+    def test_replacement_with_repeated_text(self):
+        """Prefix and suffix must not overlap when the edit repeats nearby text."""
+        edit = _compute_edit(b'aaa', b'aaaa')
+        self.assertEqual((edit['start_byte'], edit['old_end_byte'], edit['new_end_byte']), (3, 3, 4))
+
+    def test_identical(self):
+        """Unchanged content should be an empty edit at the end."""
+        edit = _compute_edit(b'x\ny', b'x\ny')
+        self.assertEqual((edit['start_byte'], edit['old_end_byte'], edit['new_end_byte']), (3, 3, 3))
+        self.assertEqual(edit['start_point'], (1, 1))
+
+
+class TestFromPrevious(unittest.TestCase):
+    """Test that an incremental re-parse matches a parse from scratch."""
+
+    OLD = 'def f(a):\n    return a\n\n\nclass C:\n    def m(self):\n        pass\n'
+    NEW = ('import os\n\n\ndef f(a, b):\n    return a + b\n\n\ndef g():\n    pass\n\n\n'
+           'class C:\n    def m(self):\n        pass\n')
+
+    def setUp(self):
+        patcher = patch.dict(os.environ, {STRUCTURE_CACHE_ENV: ''})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.previous = PythonAnalyzer('example.py', source=self.OLD)
+        if self.previous.tree is None:
+            self.skipTest("tree-sitter parser not available")
+
+    def test_matches_fresh_parse(self):
+        """Structure from the edited tree should equal a fresh parse of the new source."""
+        incremental = PythonAnalyzer.from_previous(self.previous, self.NEW)
+        fresh = PythonAnalyzer('example.py', source=self.NEW)
+
+        self.assertIsNotNone(incremental.tree)
+        self.assertEqual(incremental.get_structure(), fresh.get_structure())
+        self.assertIn('g', [f['name'] for f in incremental.get_structure()['functions']])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Tests for how tree-sitter definitions are named and categorized."""
+
+import unittest
+from reveal.analyzers.rust import RustAnalyzer
+from reveal.base import get_analyzer
+
+
+class TestCStructs(unittest.TestCase):
+    """Test that only C struct definitions are listed as structs."""
+
+    CODE = ('struct point {\n    int x;\n    int y;\n};\n\n'
+            'struct point *origin(struct point *p) {\n    return (struct point *)p;\n}\n')
+
+    def test_references_not_listed(self):
+        """References (pointers, parameters, casts, return types) are not definitions."""
+        analyzer_class = get_analyzer('example.c')
+        if analyzer_class is None:
+            self.skipTest("tree-sitter parser not available")
+        analyzer = analyzer_class('example.c', source=self.CODE)
+        if analyzer.tree is None:
+            self.skipTest("tree-sitter parser not available")
+
+        structs = analyzer.get_structure()['structs']
+        self.assertEqual([(s['name'], s['line']) for s in structs], [('point', 1)])
+
+
+class TestRustStructs(unittest.TestCase):
+    """Test that Rust structs are listed once, as structs."""
+
+    CODE = ('pub struct Point {\n    x: i32,\n}\n\n'
+            'impl Point {\n    fn new() -> Point {\n        Point { x: 0 }\n    }\n}\n')
+
+    def test_listed_once(self):
+        """A struct is not also listed as a class."""
+        analyzer = RustAnalyzer('example.rs', source=self.CODE)
+        if analyzer.tree is None:
+            self.skipTest("tree-sitter parser not available")
+
+        structure = analyzer.get_structure()
+        names = [item['name'] for category in ('classes', 'structs')
+                 for item in structure.get(category, [])]
+        self.assertEqual(names, ['Point'])
+        self.assertEqual(structure['structs'][0]['line'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+"""Tests for the type system (entities, inheritance, relationships)."""
+
+import unittest
+from typing import Dict, List, Optional, Union
+from reveal.types import Entity, TypeRegistry, RelationshipRegistry, relationship
+
+
+class TestValidateEntity(unittest.TestCase):
+    """Test property validation against entity types."""
+
+    def setUp(self):
+        self.registry = TypeRegistry()
+        self.registry.register_types({
+            'function': Entity(properties={
+                'name': str, 'line': int, 'doc': Optional[str],
+                'decorators': List[str], 'key': Union[int, str],
+            }),
+            'method': Entity(inherits='function', properties={'parent_class': str}),
+        })
+        self.registry.resolve_inheritance()
+
+    def test_valid(self):
+        """Matching values, None and missing properties pass."""
+        self.assertEqual(self.registry.validate_entity('function', {
+            'name': 'f', 'line': 1, 'doc': None, 'decorators': ['x'], 'key': 'k',
+        }), [])
+        self.assertEqual(self.registry.validate_entity('method', {'name': 'm'}), [])
+
+    def test_invalid(self):
+        """Mismatched values are reported, including inherited properties."""
+        errors = self.registry.validate_entity('method', {
+            'line': '1', 'doc': 2, 'decorators': 'x', 'key': 1.5, 'parent_class': 'C',
+        })
+        self.assertEqual([e.split("'")[1] for e in errors], ['line', 'doc', 'decorators', 'key'])
+        self.assertEqual(self.registry.validate_entity('nope', {}), ['Unknown entity type: nope'])
+
+    def test_registering_same_types_keeps_resolution(self):
+        """Re-registering identical definitions is a no-op."""
+        self.registry.register_types({'method': self.registry.get_type('method')})
+        self.registry.register_types({})
+        self.assertTrue(self.registry._inheritance_resolved)
+
+    def test_reregistering_types(self):
+        """Validation should follow types registered after earlier checks."""
+        self.registry.validate_entity('function', {'line': 1})
+        self.registry.register_types({'function': Entity(properties={'line': str})})
+        self.assertEqual(len(self.registry.validate_entity('function', {'line': 1})), 1)
+
+
+class TestEntityDefinition(unittest.TestCase):
+    """Test annotation checks when an entity is defined."""
+
+    def test_invalid_annotations_warn(self):
+        """Non-type annotations are reported; types, unions and generics are not."""
+        with self.assertLogs('reveal.types', level='WARNING') as logs:
+            Entity(properties={'a': str, 'b': Optional[List[str]], 'c': Dict[str, int],
+                               'd': 'str', 'e': Union[int, 'x'], 'f': [str]})
+        self.assertEqual([line.split("'")[1] for line in logs.output], ['d', 'e', 'f'])
+
+
+class TestResolveInheritance(unittest.TestCase):
+    """Test merging of inherited properties."""
+
+    def test_deep_chain(self):
+        """Chains longer than the recursion limit merge every ancestor."""
+        registry = TypeRegistry()
+        registry.register_types({'t0': Entity(properties={'p0': int})})
+        registry.register_types({
+            f't{i}': Entity(inherits=f't{i - 1}', properties={f'p{i}': int})
+            for i in range(2000, 0, -1)
+        })
+        registry.resolve_inheritance()
+        self.assertEqual(len(registry.get_type('t2000').properties), 2001)
+
+    def test_circular(self):
+        """Cycles raise, naming a type on the cycle."""
+        registry = TypeRegistry()
+        registry.register_types({
+            'root': Entity(properties={}),
+            'a': Entity(inherits='b', properties={}),
+            'b': Entity(inherits='a', properties={}),
+        })
+        with self.assertRaisesRegex(ValueError, 'Circular inheritance detected: a'):
+            registry.resolve_inheritance()
+
+
+class TestInheritanceQueries(unittest.TestCase):
+    """Test subtype checks and relationship type validation."""
+
+    def setUp(self):
+        self.registry = TypeRegistry()
+        self.registry.register_types({
+            'node': Entity(properties={}),
+            'function': Entity(inherits='node', properties={}),
+            'method': Entity(inherits='function', properties={}),
+            'class': Entity(inherits='node', properties={}),
+        })
+        self.registry.resolve_inheritance()
+
+    def test_is_subtype_of(self):
+        """Subtyping is reflexive and transitive, and only follows inherits."""
+        self.assertTrue(self.registry.is_subtype_of('method', 'method'))
+        self.assertTrue(self.registry.is_subtype_of('method', 'node'))
+        self.assertFalse(self.registry.is_subtype_of('function', 'method'))
+        self.assertFalse(self.registry.is_subtype_of('class', 'function'))
+        self.assertEqual(self.registry.get_ancestors('method'), {'method', 'function', 'node'})
+
+    def test_get_subtypes(self):
+        """Subtypes are listed depth-first and follow newly registered types."""
+        self.assertEqual(self.registry.get_subtypes('node'), ['function', 'method', 'class'])
+        self.assertEqual(self.registry.get_subtypes('method'), [])
+
+        self.registry.register_types({'lambda': Entity(inherits='function', properties={})})
+        self.assertEqual(self.registry.get_subtypes('node'), ['function', 'method', 'lambda', 'class'])
+
+    def test_validate_relationship_accepts_subtypes(self):
+        """Edges between subtypes of the declared types are valid."""
+        relationships = RelationshipRegistry(self.registry)
+        relationships.register_relationships({'calls': relationship(['function'], ['function'])})
+
+        edge = {'from': {'type': 'method'}, 'to': {'type': 'function'}}
+        self.assertEqual(relationships.validate_relationship('calls', edge), [])
+        edge = {'from': {'type': 'class'}, 'to': {'type': 'method'}}
+        errors = relationships.validate_relationship('calls', edge)
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Invalid 'from' type 'class'", errors[0])
+
+    def test_validate_edges(self):
+        """Batch validation reports errors with the index of their edge."""
+        relationships = RelationshipRegistry(self.registry)
+        relationships.register_relationships({'calls': relationship(['function'], ['function'])})
+
+        errors = relationships.validate_edges('calls', [
+            {'from': {'type': 'method'}, 'to': {'type': 'function'}},
+            {'from': {'type': 'class'}, 'to': {'type': 'class'}},
+            {'from': {'type': 'class'}},
+        ])
+        self.assertEqual([i for i, _ in errors], [1, 1, 2])
+        self.assertIn("Invalid 'to' type 'class'", errors[1][1])
+        self.assertEqual(errors[2][1], "Relationship edge missing 'to' key")
+
+
+class TestTraverseTransitive(unittest.TestCase):
+    """Test following transitive relationships through edge data."""
+
+    def test_reachable_in_depth_first_order(self):
+        """Chains are followed depth-first; cycles stop at visited entities."""
+        relationships = RelationshipRegistry(TypeRegistry())
+        relationships.register_relationships({
+            'inherits': relationship(['class'], ['class'], transitive=True),
+        })
+        a, b, c, d = ({'type': 'class', 'name': n} for n in 'abcd')
+        edges = {'inherits': [
+            {'from': a, 'to': b}, {'from': a, 'to': d},
+            {'from': b, 'to': c}, {'from': c, 'to': a},
+        ]}
+
+        self.assertEqual(relationships.traverse_transitive('inherits', a, edges), [b, c, a, d])
+        self.assertEqual(relationships.traverse_transitive('inherits', d, edges), [])
+
+    def test_long_chain(self):
+        """Chains longer than the recursion limit are traversed."""
+        relationships = RelationshipRegistry(TypeRegistry())
+        relationships.register_relationships({
+            'inherits': relationship(['class'], ['class'], transitive=True),
+        })
+        nodes = [{'type': 'class', 'name': str(i)} for i in range(5000)]
+        edges = {'inherits': [{'from': x, 'to': y} for x, y in zip(nodes, nodes[1:])]}
+
+        self.assertEqual(len(relationships.traverse_transitive('inherits', nodes[0], edges)), 4999)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Tests for YAML and JSON analyzers."""
+
+import unittest
+import tempfile
+import os
+from reveal.analyzers.yaml_json import YamlAnalyzer, JsonAnalyzer
+
+
+def create_temp_file(content: str, suffix: str) -> str:
+    """Helper: Create temp file with given content."""
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(fd, 'w') as f:
+        f.write(content)
+    return path
+
+
+class TestJsonAnalyzer(unittest.TestCase):
+    """Test JSON top-level key extraction."""
+
+    def analyze(self, content: str):
+        path = create_temp_file(content, '.json')
+        try:
+            return JsonAnalyzer(path).get_structure()
+        finally:
+            os.unlink(path)
+
+    def test_top_level_keys_with_lines(self):
+        """Top-level keys should be reported with the line they start on."""
+        content = '{\n  "name": "x",\n  "nested": {\n    "name": "y"\n  },\n\n  "list": [1, 2]\n}\n'
+        structure = self.analyze(content)
+
+        self.assertEqual(structure['keys'], [
+            {'line': 2, 'name': 'name'},
+            {'line': 3, 'name': 'nested'},
+            {'line': 7, 'name': 'list'},
+        ])
+
+    def test_escaped_key(self):
+        """Keys containing escapes should be decoded."""
+        structure = self.analyze('{"a\\"b": "}"}')
+        self.assertEqual(structure['keys'], [{'line': 1, 'name': 'a"b'}])
+
+    def test_non_object(self):
+        """Non-object documents have no keys."""
+        self.assertEqual(self.analyze('[1, 2, 3]'), {})
+
+    def test_semantic_slicing(self):
+        """head/tail/range should slice top-level keys."""
+        content = '{"a": 1, "b": 2, "c": 3, "d": 4}'
+        path = create_temp_file(content, '.json')
+        try:
+            analyzer = JsonAnalyzer(path)
+
+            def names(**slicing):
+                return [k['name'] for k in analyzer.get_structure(**slicing)['keys']]
+
+            self.assertEqual(names(head=2), ['a', 'b'])
+            self.assertEqual(names(tail=1), ['d'])
+            self.assertEqual(names(range=(2, 3)), ['b', 'c'])
+            self.assertEqual(names(), ['a', 'b', 'c', 'd'])
+        finally:
+            os.unlink(path)
+
+    def test_parse_shared_across_instances(self):
+        """Unchanged files should be parsed once across analyzer instances."""
+        path = create_temp_file('{"a": 1}', '.json')
+        try:
+            analyzer = JsonAnalyzer(path)
+            first = analyzer._cached_parse('keys', analyzer._parse_keys)
+            second = JsonAnalyzer(path)._cached_parse('keys', lambda: self.fail('re-parsed'))
+            self.assertIs(first, second)
+        finally:
+            os.unlink(path)
+
+    def test_invalid_json(self):
+        """Invalid JSON should return empty structure."""
+        self.assertEqual(self.analyze('{"a": 1,}'), {})
+        self.assertEqual(self.analyze('{"a": 1} trailing'), {})
+
+
+class TestYamlAnalyzer(unittest.TestCase):
+    """Test YAML top-level key extraction."""
+
+    def test_top_level_keys_with_lines(self):
+        """Top-level keys should be reported with line numbers, skipping comments."""
+        content = "# comment\nname: x\nnested:\n  inner: 1\n\nlist:\n  - a\n"
+        path = create_temp_file(content, '.yaml')
+        try:
+            structure = YamlAnalyzer(path).get_structure()
+        finally:
+            os.unlink(path)
+
+        self.assertEqual(structure['keys'], [
+            {'line': 2, 'name': 'name'},
+            {'line': 3, 'name': 'nested'},
+            {'line': 6, 'name': 'list'},
+        ])
+
+    def test_extract_key(self):
+        """Extracting a key should span up to the next top-level key."""
+        content = "name: x\nnested:\n  inner: 1\n\nlist:\n  - a\n"
+        path = create_temp_file(content, '.yaml')
+        try:
+            element = YamlAnalyzer(path).extract_element('key', 'nested')
+        finally:
+            os.unlink(path)
+
+        self.assertEqual(element['line_start'], 2)
+        self.assertEqual(element['line_end'], 4)
+        self.assertEqual(element['source'], "nested:\n  inner: 1\n")
+
+
+if __name__ == '__main__':
+    unittest.main()